@@ -0,0 +1,386 @@
+"""Shared base for the research agents (Admirer and Critic).
+
+Both agents generate a polarity-biased search query with the LLM and then
+gather evidence. Everything except the evidence-gathering strategy lives here;
+subclasses provide prompts/terms as class attributes and implement
+research_with_query.
+"""
+
+from __future__ import annotations
+
+import abc
+import asyncio
+import logging
+import os
+import random
+import uuid
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable
+
+from utils.adk_helpers import (
+    discard_session,
+    is_resource_exhausted,
+    run_first_text,
+    shared_runner,
+    stateful_sessions_enabled,
+)
+from utils.semantic_cache import SemanticQueryCache, semantic_cache_enabled
+
+if TYPE_CHECKING:
+    from google.adk import Agent
+    from google.adk.runners import InMemoryRunner
+
+logger = logging.getLogger(__name__)
+
+_QUERY_CACHE_MAX = 256
+_MAX_RETRY_DELAY_SECONDS = 30.0
+_QUERY_MAX_OUTPUT_TOKENS = 48
+
+# Typographic quotes and backticks are never useful in a search query, so drop them
+# anywhere in one translate pass; ASCII quotes are only trimmed from the edges.
+_QUOTE_TRANS = str.maketrans("", "", "`“”‘’")
+_STRIP_CHARS = " \t\"'"
+
+
+def _default_query_config(model: object) -> object:
+    """Generation config for single-line query replies: short, low-temperature, stop at newline."""
+    from google.genai import types
+
+    model_name = str(getattr(model, "model", model) or "")
+    thinking = None
+    # Gemini 2.5 counts thinking tokens against max_output_tokens; Flash models allow
+    # disabling thinking, which a 3-5 keyword query does not need.
+    if "flash" in model_name:
+        thinking = types.ThinkingConfig(thinking_budget=0)
+    return types.GenerateContentConfig(
+        max_output_tokens=_QUERY_MAX_OUTPUT_TOKENS,
+        temperature=0.2,
+        stop_sequences=["\n"],
+        thinking_config=thinking,
+    )
+
+
+class BaseResearchAgent(abc.ABC):
+    """Common query generation pipeline for the research agents.
+
+    Subclasses must set:
+        NAME: ADK agent name, also used for user/session ids
+        LABEL: Display name used in log messages
+        SYSTEM_PROMPT: ADK agent instruction
+        DESCRIPTION: ADK agent description
+        QUERY_PROMPT_PREAMBLE: Static head of the query-generation prompt
+        FALLBACK_TERMS: Terms appended to the topic when the LLM cannot be used
+    """
+
+    NAME: str = ""
+    LABEL: str = ""
+    SYSTEM_PROMPT: str = ""
+    DESCRIPTION: str = ""
+    QUERY_PROMPT_PREAMBLE: str = ""
+    FALLBACK_TERMS: str = ""
+
+    # " " + FALLBACK_TERMS, precomputed per subclass for the LLM-failure path
+    _fallback_suffix: str = ""
+
+    # Fixed instance layout: no per-instance __dict__, and a typo'd assignment fails loudly.
+    # Subclasses declare an empty __slots__ to keep it.
+    __slots__ = (
+        "model",
+        "app_name",
+        "agent",
+        "runner",
+        "user_id",
+        "session_id",
+        "_max_attempts",
+        "_base_delay",
+        "_timeout",
+        "_prev_queries_cap",
+        "_query_cache",
+        "_query_inflight",
+        "_semantic_cache",
+    )
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._fallback_suffix = f" {cls.FALLBACK_TERMS}"
+
+    def __init__(
+        self,
+        *,
+        model: object = "gemini-2.5-flash",
+        app_name: str = "historical-court",
+        generate_content_config: object | None = None,
+        runner_factory: Callable[[Agent], InMemoryRunner] | None = None,
+    ):
+        # ADK pulls in grpc/protobuf/auth; import only when an agent is actually built
+        from google.adk import Agent
+
+        self.model = model
+        self.app_name = app_name
+
+        if generate_content_config is None:
+            generate_content_config = _default_query_config(self.model)
+
+        self.agent = Agent(
+            name=self.NAME,
+            model=self.model,
+            instruction=self.SYSTEM_PROMPT,
+            description=self.DESCRIPTION,
+            generate_content_config=generate_content_config,
+        )
+        # Callers may inject a factory to manage runner/session lifetimes (e.g. a shared
+        # session service). Otherwise reuse a pooled runner across trials; session reuse
+        # across calls is opt-in via ADK_STATEFUL_SESSIONS=1, and then the fixed session
+        # id needs a runner of this agent's own so trials never share a history.
+        if runner_factory is not None:
+            self.runner = runner_factory(self.agent)
+        else:
+            self.runner = shared_runner(self.agent, self.app_name, pooled=not stateful_sessions_enabled())
+            self.agent = self.runner.agent
+        self.user_id = f"{self.NAME}_user"
+        self.session_id = f"{self.NAME}_session"
+        self.refresh_config()
+        self._query_cache: OrderedDict[tuple, str] = OrderedDict()
+        self._query_inflight: dict[tuple, asyncio.Future] = {}
+        self._semantic_cache = SemanticQueryCache(self.NAME) if semantic_cache_enabled() else None
+
+    def refresh_config(self) -> None:
+        """(Re)read retry/timeout settings from the environment."""
+        self._max_attempts = int(os.environ.get("ADK_QUERY_RETRIES", "3") or "3")
+        self._base_delay = float(os.environ.get("ADK_QUERY_RETRY_BASE_SECONDS", "1.5") or "1.5")
+        self._timeout = float(os.environ.get("ADK_QUERY_TIMEOUT_SECONDS", "30") or "30")
+        # 0 renders the full history
+        self._prev_queries_cap = max(0, int(os.environ.get("ADK_PREV_QUERIES_CAP", "8") or "8"))
+
+    def _fallback_query(self, topic: str, feedback: str = "") -> str:
+        t = (topic or "").strip()
+        if not t:
+            return self.FALLBACK_TERMS
+
+        # Simpler fallback: just topic + 2 key terms
+        return t + self._fallback_suffix
+
+    def _sanitize_query(self, query: str) -> str:
+        # str.split() collapses any whitespace run (newlines included) in one C-level pass
+        return " ".join((query or "").translate(_QUOTE_TRANS).split()).strip(_STRIP_CHARS)
+
+    def _query_cache_key(self, topic: str, feedback: str, prev_q: list[str]) -> tuple:
+        """Key on normalized inputs; prev_q is expected already deduplicated and sorted."""
+        return (
+            self._sanitize_query(topic).lower(),
+            self._sanitize_query(feedback).lower(),
+            tuple(prev_q),
+        )
+
+    def _cache_query(self, key: tuple, query: str) -> None:
+        self._query_cache[key] = query
+        self._query_cache.move_to_end(key)
+        while len(self._query_cache) > _QUERY_CACHE_MAX:
+            self._query_cache.popitem(last=False)
+
+    def _session_id_for_call(self) -> str:
+        if stateful_sessions_enabled():
+            return self.session_id
+        return f"{self.session_id}_{uuid.uuid4().hex[:8]}"
+
+    async def _release_session_id(self, session_id: str) -> None:
+        """Delete a per-call session; the stable stateful session is kept."""
+        if session_id != self.session_id:
+            await discard_session(self.runner, user_id=self.user_id, session_id=session_id)
+
+    async def generate_search_query(
+        self,
+        topic: str,
+        feedback: str = "",
+        previous_queries: list[str] = None,
+        suggested_queries: list[str] = None
+    ) -> str:
+        """Generate a polarity-biased search query for the given topic.
+
+        Args:
+            topic: The subject to research
+            feedback: Optional feedback from the Judge for refinement
+            previous_queries: List of queries already tried to avoid duplicates
+            suggested_queries: Optional list of specific queries suggested by Judge
+
+        Returns:
+            A search query string focused on this agent's perspective
+        """
+
+        # Normalize once: duplicates and whitespace variants would only waste prompt
+        # tokens and split cache keys. Only the most recent queries are rendered so the
+        # prompt does not grow with every round; sorted so equivalent histories match.
+        previous = dict.fromkeys(q.strip() for q in (previous_queries or ()) if q and q.strip())
+        previous_set = frozenset(previous)
+        prev_q = sorted(list(previous)[-self._prev_queries_cap:])  # [-0:] keeps everything
+
+        # Priority 1: Use the first suggestion from the Judge we have not already tried
+        for suggestion in suggested_queries or ():
+            suggestion = (suggestion or "").strip()
+            if suggestion and suggestion not in previous_set:
+                logger.info(f"{self.LABEL} using judge's suggested query: {suggestion}")
+                return suggestion
+
+        t = (topic or "").strip()
+        if not t:
+            return self._fallback_query(topic, feedback)
+
+        # Identical inputs produce an equivalent prompt; skip the LLM round-trip
+        cache_key = self._query_cache_key(t, feedback, prev_q)
+        cached = self._query_cache.get(cache_key)
+        if cached is not None:
+            self._query_cache.move_to_end(cache_key)
+            logger.debug(f"{self.LABEL} query cache hit", extra={"topic": t, "query": cached})
+            return cached
+
+        # Coalesce concurrent calls with the same inputs onto one LLM request
+        pending = self._query_inflight.get(cache_key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        task = asyncio.ensure_future(self._generate_query_uncached(t, feedback, prev_q, previous_set, cache_key))
+        self._query_inflight[cache_key] = task
+        task.add_done_callback(lambda _t: self._query_inflight.pop(cache_key, None))
+        return await asyncio.shield(task)
+
+    async def _generate_query_uncached(
+        self,
+        t: str,
+        feedback: str,
+        prev_q: list[str],
+        previous_set: frozenset[str],
+        cache_key: tuple,
+    ) -> str:
+        """Generate a query with the LLM (or semantic cache) and record it in the exact cache."""
+        fb = (feedback or "").strip()
+
+        semantic_text = f"{t}\n{fb}"
+        semantic_vec = None
+        if self._semantic_cache is not None:
+            similar, semantic_vec = await asyncio.to_thread(self._semantic_cache.lookup, semantic_text)
+            if similar and similar not in previous_set:
+                logger.debug(f"{self.LABEL} semantic query cache hit", extra={"topic": t, "query": similar})
+                self._cache_query(cache_key, similar)
+                return similar
+
+        parts = [
+            self.QUERY_PROMPT_PREAMBLE,
+            "TOPIC: ", t, "\n",
+            "FEEDBACK: ", fb if fb else "None", "\n",
+        ]
+        if prev_q:
+            parts.append("\nDO NOT use any of these previously tried queries:\n")
+            parts.append("\n".join(f"- {q}" for q in prev_q))
+            parts.append("\nGenerate a DIFFERENT query with new search angles.")
+        prompt = "".join(parts)
+
+        max_attempts, base_delay, timeout = self._max_attempts, self._base_delay, self._timeout
+
+        t_lower = t.lower()
+        last_error: Exception | None = None
+        last_error_str = ""
+        for attempt in range(max_attempts):
+            try:
+                # Bound each attempt so a hung call is retried instead of eating the budget
+                session_id = self._session_id_for_call()
+                try:
+                    text = await asyncio.wait_for(
+                        run_first_text(
+                            self.runner,
+                            prompt,
+                            user_id=self.user_id,
+                            session_id=session_id,
+                        ),
+                        timeout=timeout,
+                    )
+                finally:
+                    # Per-call sessions are never resumed; drop them so the pooled
+                    # runner's in-memory store does not grow with every query
+                    await self._release_session_id(session_id)
+                query = self._sanitize_query(text or "")
+
+                # Ensure topic is present, but avoid double quoting if possible
+                if t_lower not in query.lower():
+                    # If the query is very short, just append it
+                    query = f"{t} {query}".strip()
+
+                if not query:
+                    logger.info(f"{self.LABEL} returned empty query; using fallback", extra={"topic": t})
+                    return self._fallback_query(t, feedback)
+
+                logger.debug(f"{self.LABEL} generated search query", extra={"topic": t, "query": query})
+                self._cache_query(cache_key, query)
+                if self._semantic_cache is not None:
+                    await asyncio.to_thread(self._semantic_cache.store, semantic_text, query, semantic_vec)
+                return query
+
+            except Exception as e:
+                last_error = e
+                # Materialize the message once; some API errors serialize rich metadata in __str__
+                last_error_str = str(e)
+                # The last attempt never retries, so skip classifying the error at all
+                if attempt < max_attempts - 1 and (
+                    isinstance(e, asyncio.TimeoutError) or is_resource_exhausted(e, last_error_str)
+                ):
+                    # Capped exponential backoff with jitter so Admirer and Critic, which
+                    # often hit the quota together, do not retry in lockstep
+                    delay = min(_MAX_RETRY_DELAY_SECONDS, base_delay * (2 ** attempt))
+                    delay = random.uniform(delay * 0.5, delay)
+                    await asyncio.sleep(delay)
+                    continue
+                break
+
+        logger.info(
+            f"{self.LABEL} failed to generate search query; using fallback",
+            extra={"topic": t, "error": last_error_str},
+        )
+        return self._fallback_query(t, feedback)
+
+    async def research(self, topic: str, feedback: str = "", previous_queries: list[str] = None, suggested_queries: list[str] = None) -> str:
+        """Complete research cycle: generate query, search, return findings.
+
+        Args:
+            topic: The subject to research
+            feedback: Optional feedback from the Judge for refinement
+            previous_queries: List of queries already tried to avoid duplicates
+            suggested_queries: Optional list of specific queries suggested by Judge
+
+        Returns:
+            String containing this agent's findings
+        """
+        query, findings = await self.research_with_query(topic, feedback, previous_queries, suggested_queries)
+        return findings
+
+    async def research_many(
+        self,
+        topics: list[str],
+        *,
+        max_concurrency: int = 16,
+    ) -> list[tuple[str, str] | BaseException]:
+        """Research several topics concurrently, bounded by a semaphore.
+
+        Args:
+            topics: Subjects to research
+            max_concurrency: Maximum number of in-flight research cycles
+
+        Returns:
+            (query, findings) per topic in input order; failures are returned
+            as the exception rather than aborting the batch
+        """
+        sem = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _bounded(topic: str) -> tuple[str, str]:
+            async with sem:
+                return await self.research_with_query(topic)
+
+        return await asyncio.gather(*(_bounded(topic) for topic in topics), return_exceptions=True)
+
+    @abc.abstractmethod
+    async def research_with_query(
+        self,
+        topic: str,
+        feedback: str = "",
+        previous_queries: list[str] = None,
+        suggested_queries: list[str] = None
+    ) -> tuple[str, str]:
+        """Complete research cycle and return both query and findings."""
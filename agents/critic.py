@@ -9,18 +9,59 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
-import re
-import uuid
 
-from google.adk import Agent
-from google.adk.runners import InMemoryRunner
-
-from utils.adk_helpers import extract_text
-from utils.wiki_tool import search_and_summarize
-from utils.search import search_with_fallback
+from agents._base import BaseResearchAgent
+from utils.search import _search_with_fallback, search_with_fallback
 
 logger = logging.getLogger(__name__)
 
+# Token Jaccard above which the generated query counts as the fallback query, so the
+# speculative search's result is reused instead of searching again
+_SPECULATIVE_MATCH_JACCARD = 0.7
+
+
+def _speculative_search_enabled() -> bool:
+    return (os.environ.get("CRITIC_SPECULATIVE_SEARCH", "0") or "0").strip().lower() in {
+        "1",
+        "true",
+        "yes",
+        "y",
+    }
+
+
+def _queries_match(query: str, other: str) -> bool:
+    """True if two queries are equal after normalization or share most of their tokens."""
+    a, b = set(query.lower().split()), set(other.lower().split())
+    if not a or not b:
+        return False
+    return a == b or len(a & b) / len(a | b) > _SPECULATIVE_MATCH_JACCARD
+
+
+def _is_generic_topic_page(text: str, topic_name: str) -> bool:
+    """True if findings contain exactly one page and its title is the bare topic."""
+    if not text:
+        return False
+    topic_norm = topic_name.strip().lower()
+    if not topic_norm:
+        return False
+    # Page headers always start a line; str.count/find avoid a MULTILINE regex scan
+    at_start = text.startswith("Page:")
+    if text.count("\nPage:") + at_start != 1:
+        return False
+    idx = 0 if at_start else text.find("\nPage:") + 1
+    line_end = text.find("\n", idx)
+    title = text[idx + 5 : line_end if line_end != -1 else None].strip().lower()
+    return title == topic_norm
+
+def _attributed_summary(result: dict) -> str:
+    """Return the result's summary, prefixed with a source link for DuckDuckGo results."""
+    summary = result.get('summary', '')
+    if result.get('source') != 'duckduckgo':
+        return summary
+    title = result.get('title', 'Unknown Source')
+    url = result.get('url', '')
+    return f"[Source: DuckDuckGo - {title}]({url})\n\n{summary}"
+
 CRITIC_SYSTEM_PROMPT = """You are The Critic, a cynical historian who scrutinizes historical figures and events with a critical eye.
 
 Your Role:
@@ -42,7 +83,7 @@ Return ONLY the search query, nothing else. No explanations, no formatting.
 """
 
 
-class CriticAgent:
+class CriticAgent(BaseResearchAgent):
     """The Critic agent that researches negative/controversial aspects of topics.
 
     Attributes:
@@ -50,207 +91,25 @@ class CriticAgent:
         config: Configuration for content generation
     """
 
-    def __init__(
-        self,
-        *,
-        model: object = "gemini-2.5-flash",
-        app_name: str = "historical-court",
-        generate_content_config: object | None = None,
-    ):
-        self.model = model
-        self.app_name = app_name
-
-        self.agent = Agent(
-            name="critic",
-            model=self.model,
-            instruction=CRITIC_SYSTEM_PROMPT,
-            description="Critical historian focusing on controversies and failures.",
-            generate_content_config=generate_content_config,
-        )
-        self.runner = InMemoryRunner(agent=self.agent, app_name=self.app_name)
-        self.user_id = "critic_user"
-        self.session_id = "critic_session"
-
-    def _fallback_query(self, topic: str, feedback: str = "") -> str:
-        t = (topic or "").strip()
-        if not t:
-            return "controversy criticism"
-
-        # Simpler fallback: just topic + 2 key terms
-        return f"{t} controversy criticism"
-
-    def _sanitize_query(self, query: str) -> str:
-        q = (query or "").strip()
-        q = re.sub(r"[\r\n]+", " ", q)
-        q = q.strip(" \t\"'`“”‘’")
-        q = re.sub(r"\s+", " ", q).strip()
-        return q
-
-    @staticmethod
-    def _is_resource_exhausted(err: Exception) -> bool:
-        """Detect Google ADK/GenAI rate limit (429) errors robustly.
-        
-        Walks exception chain to catch:
-        - google.adk.models.google_llm._ResourceExhaustedError (ADK wrapper)
-        - google.genai.errors.ClientError with status 429
-        - Any exception containing "RESOURCE_EXHAUSTED" or "429"
-        """
-        # Walk exception chain
-        current = err
-        while current is not None:
-            # Check class name for Google ADK specific errors
-            cls_name = current.__class__.__name__
-            module_name = current.__class__.__module__
-            
-            # Check for Google ADK ResourceExhaustedError
-            if cls_name == "_ResourceExhaustedError" and "google.adk.models.google_llm" in module_name:
-                return True
-            
-            # Check for Google GenAI ClientError with status 429
-            if cls_name == "ClientError" and "google.genai.errors" in module_name:
-                # Check if it's a 429 error
-                err_str = str(current).upper()
-                if "429" in err_str or "RESOURCE_EXHAUSTED" in err_str:
-                    return True
-            
-            # Check error message for common patterns
-            msg = str(current).upper()
-            if "RESOURCE_EXHAUSTED" in msg or "429" in msg:
-                return True
-            
-            # Move to __cause__ or __context__
-            if hasattr(current, "__cause__") and current.__cause__:
-                current = current.__cause__
-            elif hasattr(current, "__context__") and current.__context__:
-                current = current.__context__
-            else:
-                break
-        
-        return False
-
-    def _session_id_for_call(self) -> str:
-        stateful = (os.environ.get("ADK_STATEFUL_SESSIONS", "0") or "0").strip().lower() in {
-            "1",
-            "true",
-            "yes",
-            "y",
-        }
-        if stateful:
-            return self.session_id
-        return f"{self.session_id}_{uuid.uuid4().hex[:8]}"
-
-    async def generate_search_query(
-        self,
-        topic: str,
-        feedback: str = "",
-        previous_queries: list[str] = None,
-        suggested_queries: list[str] = None
-    ) -> str:
-        """Generate a critical search query for the given topic.
-
-        Args:
-            topic: The subject to research
-            feedback: Optional feedback from the Judge for refinement
-            previous_queries: List of queries already tried to avoid duplicates
-            suggested_queries: Optional list of specific queries suggested by Judge
-
-        Returns:
-            A search query string focused on negative/controversial aspects
-        """
-
-        # Priority 1: Use specific suggestions from the Judge if available
-        if suggested_queries:
-            # Filter out queries we've already used
-            previous_set = set(previous_queries or [])
-            valid_suggestions = [q for q in suggested_queries if q not in previous_set]
-            
-            if valid_suggestions:
-                # Use the first valid suggestion
-                suggestion = valid_suggestions[0]
-                logger.info(f"Critic using judge's suggested query: {suggestion}")
-                return suggestion
-
-        t = (topic or "").strip()
-        if not t:
-            return self._fallback_query(topic, feedback)
-
-        fb = (feedback or "").strip()
-        prev_q = (previous_queries or [])
-        
-        previous_queries_str = ""
-        if prev_q:
-            previous_queries_str = (
-                "\nDO NOT use any of these previously tried queries:\n" +
-                "\n".join(f"- {q}" for q in prev_q) +
-                "\nGenerate a DIFFERENT query with new search angles."
-            )
-
-        prompt = (
-            "Generate a TARGETED Wikipedia search query (3-6 keywords) for CONTROVERSIAL/CRITICAL info.\n"
-            f"TOPIC: {t}\n"
-            f"FEEDBACK: {fb if fb else 'None'}\n"
-            f"{previous_queries_str}\n"
-            "REQUIREMENTS:\n"
-            "1. Focus on specific scandals, criticisms, failures, or negative legacy.\n"
-            "2. Combine the topic with terms like: controversy, criticism, scandal, allegations, failure, crimes, dispute.\n"
-            "3. Example: instead of just 'Steve Jobs', use 'Steve Jobs criticism' or 'Steve Jobs antitrust'.\n"
-            "4. Do NOT use quotes or complex operators."
-        )
-
-        max_attempts = int(os.environ.get("ADK_QUERY_RETRIES", "3") or "3")
-        base_delay = float(os.environ.get("ADK_QUERY_RETRY_BASE_SECONDS", "1.5") or "1.5")
-
-        last_error: Exception | None = None
-        for attempt in range(max_attempts):
-            try:
-                events = await self.runner.run_debug(
-                    prompt,
-                    user_id=self.user_id,
-                    session_id=self._session_id_for_call(),
-                    quiet=True,
-                )
-                query = self._sanitize_query(extract_text(events) or "")
-
-                # Ensure topic is present, but avoid double quoting if possible
-                if t and t.lower() not in query.lower():
-                    # If the query is very short, just append it
-                    query = f"{t} {query}".strip()
-
-                if not query:
-                    logger.info("Critic returned empty query; using fallback", extra={"topic": t})
-                    return self._fallback_query(topic, feedback)
-
-                logger.debug("Critic generated search query", extra={"topic": t, "query": query})
-                return query
-
-            except Exception as e:
-                last_error = e
-                if self._is_resource_exhausted(e) and attempt < max_attempts - 1:
-                    delay = base_delay * (2 ** attempt)
-                    await asyncio.sleep(delay)
-                    continue
-                break
-
-        logger.info(
-            "Critic failed to generate search query; using fallback",
-            extra={"topic": t, "error": str(last_error) if last_error else ""},
-        )
-        return self._fallback_query(topic, feedback)
-
-    async def research(self, topic: str, feedback: str = "", previous_queries: list[str] = None, suggested_queries: list[str] = None) -> str:
-        """Complete research cycle: generate query, search Wikipedia, return findings.
-
-        Args:
-            topic: The subject to research
-            feedback: Optional feedback from the Judge for refinement
-            previous_queries: List of queries already tried to avoid duplicates
-            suggested_queries: Optional list of specific queries suggested by Judge
-
-        Returns:
-            String containing the critical findings from Wikipedia
-        """
-        query, findings = await self.research_with_query(topic, feedback, previous_queries, suggested_queries)
-        return findings
+    NAME = "critic"
+    LABEL = "Critic"
+    SYSTEM_PROMPT = CRITIC_SYSTEM_PROMPT
+    DESCRIPTION = "Critical historian focusing on controversies and failures."
+    # Static instructions go first so the prompt prefix is byte-identical across calls
+    # (provider prompt caching only matches on the longest shared prefix).
+    QUERY_PROMPT_PREAMBLE = (
+        "Generate a TARGETED Wikipedia search query (3-6 keywords) for CONTROVERSIAL/CRITICAL info.\n"
+        "REQUIREMENTS:\n"
+        "1. Focus on specific scandals, criticisms, failures, or negative legacy.\n"
+        "2. Combine the topic with terms like: controversy, criticism, scandal, allegations, failure, crimes, dispute.\n"
+        "3. Example: instead of just 'Steve Jobs', use 'Steve Jobs criticism' or 'Steve Jobs antitrust'.\n"
+        "4. Do NOT use quotes or complex operators.\n"
+    )
+    FALLBACK_TERMS = "controversy criticism"
+    # Appended to the query when Wikipedia only returns the topic's own article
+    BROADEN_TERMS = "controversy scandal"
+
+    __slots__ = ()
 
     async def research_with_query(
         self,
@@ -269,54 +128,85 @@ class CriticAgent:
         if not t:
             return "", "No topic provided."
 
-        query = await self.generate_search_query(t, feedback, previous_queries, suggested_queries)
+        if not _speculative_search_enabled():
+            query = await self.generate_search_query(t, feedback, previous_queries, suggested_queries)
+            return await self._gather_findings(t, query)
+
+        # CRITIC_SPECULATIVE_SEARCH: search the fallback query while the LLM generates the
+        # real one, and use that result when the two queries (nearly) match. This calls
+        # the unshielded _search_with_fallback, so cancelling it on a mismatch stops it
+        # before any DDG request (a Wikipedia lookup already in its worker thread still
+        # finishes and warms the Wikipedia cache).
+        fallback_query = self._fallback_query(t)
+        speculative = asyncio.create_task(_search_with_fallback(fallback_query, t, True, t))
+        reused = False
+        try:
+            query = await self.generate_search_query(t, feedback, previous_queries, suggested_queries)
+            reused = _queries_match(query, fallback_query)
+        finally:
+            if not reused:
+                speculative.cancel()
+                try:
+                    await speculative
+                except asyncio.CancelledError:
+                    pass
+                except Exception as e:
+                    logger.debug(f"Speculative Critic search failed: {e}")
+        if not reused:
+            return await self._gather_findings(t, query)
+        logger.debug("Reusing speculative Critic search", extra={"topic": t, "query": query})
+        return await self._gather_findings(t, query, speculative)
+
+    async def _gather_findings(
+        self,
+        t: str,
+        query: str,
+        primary: asyncio.Task | None = None,
+    ) -> tuple[str, str]:
+        """Run the primary search (with broadening), then the fallback if it came back empty.
 
-        findings = ""
-        def _is_generic_topic_page(text: str, topic_name: str) -> bool:
-            if not text:
-                return False
-            titles = re.findall(r"^Page:\s*(.+)$", text, flags=re.MULTILINE)
-            if not titles:
-                return False
-            titles_norm = [t.strip().lower() for t in titles if t.strip()]
-            topic_norm = topic_name.strip().lower()
-            if not topic_norm:
-                return False
-            return len(titles_norm) == 1 and titles_norm[0] == topic_norm
+        Args:
+            t: The stripped topic
+            query: The primary search query
+            primary: An already running search for query to await instead of searching
+        """
 
+        findings = ""
         try:
             # Use search_with_fallback which tries Wikipedia then DuckDuckGo
-            search_result = await search_with_fallback(
-                query=query,
-                topic=t,
-                use_ddg_fallback=True,
-                focus_term=t,
+            search_result = await (
+                primary
+                if primary is not None
+                else search_with_fallback(
+                    query=query,
+                    topic=t,
+                    use_ddg_fallback=True,
+                    focus_term=t,
+                )
             )
             
-            findings = search_result.get('summary', '')
+            findings = _attributed_summary(search_result)
             source = search_result.get('source', 'unknown')
             
-            if source == 'duckduckgo':
-                # Add attribution for DDG results
-                title = search_result.get('title', 'Unknown Source')
-                url = search_result.get('url', '')
-                findings = f"[Source: DuckDuckGo - {title}]({url})\n\n{findings}"
-            elif source == 'wikipedia' and _is_generic_topic_page(findings, t):
+            if source == 'wikipedia' and _is_generic_topic_page(findings, t):
                 logger.info("Generic topic page returned; broadening search", extra={"topic": t, "query": query})
+                # Re-running the same query would return the same page; use a distinct,
+                # wider query once and keep the generic page if that does not help either
+                broaden_query = f"{query} {self.BROADEN_TERMS}"
                 broadened = await search_with_fallback(
-                    query=query,
+                    query=broaden_query,
                     topic=t,
                     use_ddg_fallback=True,
-                    focus_term=t,
+                    focus_term=None,
                 )
-                broadened_findings = broadened.get('summary', '')
+                broadened_findings = _attributed_summary(broadened)
                 broadened_source = broadened.get('source', 'unknown')
-                if broadened_source == 'duckduckgo':
-                    title = broadened.get('title', 'Unknown Source')
-                    url = broadened.get('url', '')
-                    broadened_findings = f"[Source: DuckDuckGo - {title}]({url})\n\n{broadened_findings}"
-                if broadened_findings:
-                    findings = broadened_findings
+                if (
+                    broadened_source != 'none'
+                    and broadened_findings
+                    and not _is_generic_topic_page(broadened_findings, t)
+                ):
+                    query, findings = broaden_query, broadened_findings
                 
         except Exception as e:
             logger.warning(f"Research failed for primary query '{query}': {e}")
@@ -333,8 +223,7 @@ class CriticAgent:
         if is_failure:
             logger.info("No results for primary query, trying fallback", extra={"topic": t, "query": query})
             
-            # Simple fallback query
-            fallback_query = f"{t} controversy criticism"
+            fallback_query = self._fallback_query(t)
             try:
                 search_result = await search_with_fallback(
                     query=fallback_query,
@@ -342,14 +231,8 @@ class CriticAgent:
                     use_ddg_fallback=True,
                     focus_term=None,
                 )
-                findings = search_result.get('summary', '')
-                source = search_result.get('source', 'unknown')
-                
-                if source == 'duckduckgo':
-                    title = search_result.get('title', 'Unknown Source')
-                    url = search_result.get('url', '')
-                    findings = f"[Source: DuckDuckGo - {title}]({url})\n\n{findings}"
-                
+                findings = _attributed_summary(search_result)
+
                 if findings and not findings.lower().startswith("no information found"):
                     return fallback_query, findings
             except Exception as e:
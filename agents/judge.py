@@ -10,22 +10,37 @@ Uses Google ADK tool calling to signal decisions.
 from __future__ import annotations
 
 import asyncio
-import json
+import contextlib
+import copy
+import hashlib
 import logging
 import os
 import random
+import re
 import uuid
-from dataclasses import dataclass, field
+import weakref
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field, replace
 from typing import Any, Dict, Optional, List
 
 from google.adk import Agent
-from google.adk.runners import InMemoryRunner
 
-from utils.adk_helpers import extract_text, extract_tool_result
+from utils.adk_helpers import (
+    context_cache_config,
+    discard_session,
+    is_resource_exhausted,
+    run_until_tool_response,
+    scan_events,
+    shared_runner,
+    stateful_sessions_enabled,
+)
+from utils.tokenizer import count_tokens, tokenizer_available
 
 logger = logging.getLogger(__name__)
 
 
+# Round-independent so the system block is a byte-identical prefix on every call, which
+# lets provider-side prompt caching reuse it; the round lives in the user message.
 JUDGE_SYSTEM_PROMPT = """You are The Judge, an impartial arbiter presiding over The Historical Court.
 
 Your Role:
@@ -47,7 +62,7 @@ REJECT (Continue Trial):
 - If important aspects haven't been explored
 - Provide specific feedback for the weaker side to improve
 
-CRITICAL EXCEPTION: YOU CANNOT REJECT IN THE FINAL ROUND ({max_rounds} of {max_rounds}).
+CRITICAL EXCEPTION: YOU CANNOT REJECT IN THE FINAL ROUND (CURRENT ROUND Y of Y).
 In the final round, you MUST ACCEPT and render a verdict with whatever evidence is available.
 
 When rejecting evidence as insufficient (ONLY allowed if NOT final round), you MUST provide:
@@ -71,7 +86,7 @@ ACCEPT (End Trial):
 - If both sides have presented balanced, substantial evidence
 - If the topic has been thoroughly examined
 - If additional rounds would not significantly improve the verdict
-- If this is the FINAL ROUND ({max_rounds}), you MUST ACCEPT regardless of evidence quality.
+- If this is the FINAL ROUND, you MUST ACCEPT regardless of evidence quality.
 - Call the exit_loop function with a balanced verdict summary
 
 When accepting, generate a verdict that:
@@ -81,8 +96,8 @@ When accepting, generate a verdict that:
 - Is written in a formal, judicial tone
 
 Round Awareness:
-Current round: {round_count} of {max_rounds}
-- If this is the FINAL ROUND ({max_rounds}), you are REQUIRED to render a verdict. Do not request more evidence.
+Each request states the CURRENT ROUND as "X of Y"; round Y is the FINAL ROUND.
+- If this is the FINAL ROUND, you are REQUIRED to render a verdict. Do not request more evidence.
 - You can LOWER the "Balance" threshold if one side has overwhelming evidence and the other side has been thoroughly researched but lacks results.
 - Earlier rounds allow more flexibility to request additional evidence.
 
@@ -92,10 +107,72 @@ Tool Instructions:
 """
 
 
-def exit_loop(verdict: str, confidence: str, summary: Optional[dict] = None) -> str:
+_FINAL_ROUND_INSTRUCTIONS = (
+    "🚨 FINAL ROUND ALERT 🚨\n"
+    "This is the FINAL round. You are PROHIBITED from requesting more evidence.\n"
+    "You MUST call the `exit_loop` tool now.\n"
+    "Render your verdict based on whatever evidence you have, even if imperfect.\n"
+    "Do NOT provide feedback. Do NOT ask for queries. CALL `exit_loop` IMMEDIATELY.\n"
+)
+
+_DELIBERATION_INSTRUCTIONS = (
+    "Deliberate carefully.\n"
+    "- If evidence is sufficient and balanced, call exit_loop.\n"
+    "- If evidence is insufficient, provide specific feedback for the next round.\n"
+)
+
+
+def _round_directive(round_number: int, max_rounds: int) -> str:
+    """Round header plus final-round or deliberation instructions for the user message."""
+    instructions = _FINAL_ROUND_INSTRUCTIONS if round_number >= max_rounds else _DELIBERATION_INSTRUCTIONS
+    return f"CURRENT ROUND: {round_number} of {max_rounds}\n\n{instructions}"
+
+
+# Suggested-query parsing for rejection feedback
+_SECTION_RE = re.compile(r"SUGGESTED QUERIES(?: FOR (ADMIRER|CRITIC))?", re.IGNORECASE)
+_BULLET_RE = re.compile(r"[-*\d][-*\d.)\s]*(.*)")
+_QUOTED_RE = re.compile(r"[\"']([^\"']+)[\"']")
+
+
+def _parse_suggested_queries(feedback: str) -> tuple[list[str], list[str]]:
+    """Collect bullet-point queries listed under the per-agent headers in Judge feedback.
+
+    Returns:
+        Tuple of (admirer_queries, critic_queries)
+    """
+    queries: dict[str, list[str]] = {"admirer": [], "critic": []}
+    current: list[str] | None = None
+
+    for line in feedback.splitlines():
+        line = line.strip()
+        header = _SECTION_RE.search(line)
+        if header is not None:
+            if header.group(1):
+                current = queries[header.group(1).lower()]
+                continue
+            if header.start() == 0:
+                current = None  # reset if ambiguous header
+
+        if current is None:
+            continue
+        bullet = _BULLET_RE.match(line)
+        if bullet is None:
+            continue
+        # Extract query from quotes if present, otherwise the rest of the line
+        rest = bullet.group(1)
+        quoted = _QUOTED_RE.search(rest)
+        query = quoted.group(1) if quoted else rest.strip()
+        if query:
+            current.append(query)
+
+    return queries["admirer"], queries["critic"]
+
+
+def exit_loop(verdict: str, confidence: str, summary: Optional[dict] = None) -> dict[str, Any]:
     """Tool called by the Judge to accept the trial and return a verdict.
 
-    Returns a JSON string so the caller can parse and validate fields.
+    Returns a dict; ADK passes it through as the function response unchanged,
+    so the caller reads the fields without a JSON round-trip.
     """
 
     payload: dict[str, Any] = {
@@ -104,7 +181,122 @@ def exit_loop(verdict: str, confidence: str, summary: Optional[dict] = None) ->
     }
     if summary is not None:
         payload["summary"] = summary
-    return json.dumps(payload, ensure_ascii=False)
+    return payload
+
+
+# Fleet-wide cap on in-flight Judge model calls across all JudgeAgent instances, so
+# bulk runs (many concurrent trials) queue here instead of tripping provider 429s.
+# One semaphore per event loop, since asyncio primitives are loop-bound.
+_JUDGE_SLOTS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = weakref.WeakKeyDictionary()
+
+
+def _judge_slot(limit: int) -> asyncio.Semaphore | None:
+    """Return this loop's Judge call semaphore, or None when limit (JUDGE_MAX_CONCURRENCY) is 0."""
+    if limit <= 0:
+        return None
+    loop = asyncio.get_running_loop()
+    sem = _JUDGE_SLOTS.get(loop)
+    if sem is None:
+        sem = _JUDGE_SLOTS[loop] = asyncio.Semaphore(limit)
+    return sem
+
+
+# 429 backoff before jitter: 3s (longer than the default 1.5s base) doubling per attempt
+_RATE_LIMIT_BACKOFF = tuple(3.0 * (2 ** i) for i in range(8))
+_RATE_LIMIT_MAX_DELAY = 30.0
+
+# Items whose word 4-gram sets overlap beyond this are treated as the same claim
+_NEAR_DUPLICATE_JACCARD = 0.85
+_WORD_RE = re.compile(r"\w+")
+
+
+def _shingles(text: str, n: int = 4) -> set:
+    """Return the set of lowercase word n-grams of text (the whole text if shorter)."""
+    words = _WORD_RE.findall(text.lower())
+    if len(words) <= n:
+        return {tuple(words)}
+    return {tuple(words[i : i + n]) for i in range(len(words) - n + 1)}
+
+
+def _jaccard(a: set, b: set) -> float:
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+_VALID_CONFIDENCE = frozenset({"low", "medium", "high"})
+
+
+def _parse_tool_result(tool_result: Any) -> tuple[str, str, Dict[str, Any] | None]:
+    """Return (verdict, confidence, summary) from exit_loop's payload.
+
+    Fields are stripped; an unrecognized confidence becomes "" ("FORCED..." values are
+    allowed alongside the standard levels) and a non-dict summary becomes None.
+    """
+    if not isinstance(tool_result, dict):
+        return "", "", None
+    verdict = str(tool_result.get("verdict") or "").strip()
+    confidence = str(tool_result.get("confidence") or "").strip()
+    if confidence and confidence.lower() not in _VALID_CONFIDENCE and not confidence.startswith("FORCED"):
+        confidence = ""
+    summary = tool_result.get("summary")
+    return verdict, confidence, summary if isinstance(summary, dict) else None
+
+# LRU of model-produced decisions shared by all JudgeAgent instances; the size is
+# JUDGE_RESPONSE_CACHE_SIZE (read per instance), 0 disables it
+_DECISION_CACHE_DEFAULT_SIZE = 256
+_DECISION_CACHE: OrderedDict[str, JudgeDecision] = OrderedDict()
+
+
+def _decision_cache_key(
+    topic: str,
+    positive_evidence: list,
+    negative_evidence: list,
+    round_number: int,
+    max_rounds: int,
+    model: object,
+) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    for part in (
+        str(getattr(model, "model", model)),
+        topic,
+        "\x1f".join(map(str, positive_evidence or ())),
+        "\x1f".join(map(str, negative_evidence or ())),
+        f"{round_number}/{max_rounds}",
+    ):
+        h.update(part.encode("utf-8", "surrogatepass"))
+        h.update(b"\x1e")
+    return h.hexdigest()
+
+
+# Formatted evidence blocks kept per JudgeAgent (two per live trial: one per side)
+_EVIDENCE_FMT_CACHE_SIZE = 16
+
+
+def _copy_decision(decision: JudgeDecision) -> JudgeDecision:
+    return replace(
+        decision,
+        summary=copy.deepcopy(decision.summary),
+        suggested_queries_admirer=list(decision.suggested_queries_admirer),
+        suggested_queries_critic=list(decision.suggested_queries_critic),
+    )
+
+
+def _cached_decision(key: str) -> JudgeDecision | None:
+    """Return a copy of a cached decision so callers cannot mutate the cached one."""
+    decision = _DECISION_CACHE.get(key)
+    if decision is None:
+        return None
+    _DECISION_CACHE.move_to_end(key)
+    return _copy_decision(decision)
+
+
+def _cache_decision(key: str, decision: JudgeDecision, max_entries: int) -> None:
+    """Record a model-produced decision; error fallbacks are never passed in."""
+    if max_entries <= 0:
+        return
+    _DECISION_CACHE[key] = _copy_decision(decision)
+    _DECISION_CACHE.move_to_end(key)
+    while len(_DECISION_CACHE) > max_entries:
+        _DECISION_CACHE.popitem(last=False)
 
 
 @dataclass(slots=True)
@@ -123,6 +315,29 @@ class JudgeDecision:
 class JudgeAgent:
     """The Judge agent that evaluates evidence and controls trial flow."""
 
+    __slots__ = (
+        "max_rounds",
+        "_directive_by_round",
+        "model",
+        "app_name",
+        "agent",
+        "runner",
+        "user_id",
+        "session_id",
+        "_max_attempts",
+        "_base_delay",
+        "_timeout",
+        "_stateful_sessions",
+        "_expose_internal_errors",
+        "_max_concurrency",
+        "_shortcircuit_empty",
+        "_session_pool",
+        "_decision_cache_size",
+        "_evidence_budget",
+        "_dedup_evidence",
+        "_evidence_fmt_cache",
+    )
+
     def __init__(
         self,
         *,
@@ -135,6 +350,8 @@ class JudgeAgent:
             raise ValueError("max_rounds must be an integer >= 1")
 
         self.max_rounds = max_rounds
+        # Every reachable round's directive, built once so prompts only index a tuple
+        self._directive_by_round = tuple(_round_directive(r, max_rounds) for r in range(max_rounds + 2))
         self.model = model
         self.app_name = app_name
 
@@ -146,12 +363,66 @@ class JudgeAgent:
             tools=[exit_loop],
             generate_content_config=generate_content_config,
         )
-        self.runner = InMemoryRunner(agent=self.agent, app_name=self.app_name)
+        # Reuse a pooled runner across trials instead of rebuilding it per JudgeAgent. The
+        # system prompt and tools are a static prefix, which Gemini 2.5 caches implicitly;
+        # ADK_CONTEXT_CACHE=1 additionally opts into explicit context caching.
+        # A stateful Judge (fixed session id) gets a runner of its own so trials never
+        # share one conversation history.
+        self.runner = shared_runner(
+            self.agent,
+            self.app_name,
+            cache_config=context_cache_config(),
+            pooled=not stateful_sessions_enabled(),
+        )
+        self.agent = self.runner.agent
         self.user_id = "judge_user"
         # NOTE: Using a fixed session_id causes the InMemoryRunner to accumulate conversation
         # history across rounds, which can bloat context and trigger API "internal" failures.
         # Default to stateless-by-round behavior; can be overridden via ADK_STATEFUL_SESSIONS=1.
         self.session_id = "judge_session"
+        self.refresh_config()
+        self._evidence_fmt_cache: dict[tuple, tuple[tuple, bool, str]] = {}
+
+    @property
+    def stateful_sessions(self) -> bool:
+        """Whether rounds share one session (ADK_STATEFUL_SESSIONS=1), tying the Judge to a single trial."""
+        return self._stateful_sessions
+
+    def refresh_config(self) -> None:
+        """(Re)read retry/timeout, session, concurrency, error and evidence-budget settings from the environment."""
+        self._max_attempts = int(os.environ.get("ADK_JUDGE_RETRIES", "3") or "3")
+        self._base_delay = float(os.environ.get("ADK_JUDGE_RETRY_BASE_SECONDS", "1.5") or "1.5")
+        self._timeout = float(os.environ.get("ADK_JUDGE_TIMEOUT_SECONDS", "60") or "60")
+        self._stateful_sessions = stateful_sessions_enabled()
+        self._expose_internal_errors = (os.environ.get("EXPOSE_JUDGE_INTERNAL_ERRORS", "0") or "0").strip().lower() in {
+            "1",
+            "true",
+            "yes",
+            "y",
+        }
+        self._shortcircuit_empty = (os.environ.get("JUDGE_SHORTCIRCUIT_EMPTY", "0") or "0").strip().lower() in {
+            "1",
+            "true",
+            "yes",
+            "y",
+        }
+        self._max_concurrency = int(os.environ.get("JUDGE_MAX_CONCURRENCY", "0") or "0")
+        self._session_pool: deque[str] = deque(maxlen=max(0, int(os.environ.get("JUDGE_SESSION_POOL", "4") or "4")))
+        self._decision_cache_size = int(
+            os.environ.get("JUDGE_RESPONSE_CACHE_SIZE", str(_DECISION_CACHE_DEFAULT_SIZE))
+            or _DECISION_CACHE_DEFAULT_SIZE
+        )
+        self._dedup_evidence = (os.environ.get("JUDGE_DEDUP_EVIDENCE", "0") or "0").strip().lower() in {
+            "1",
+            "true",
+            "yes",
+            "y",
+        }
+        self._evidence_budget = (
+            int(os.environ.get("JUDGE_EVIDENCE_MAX_CHARS", "2400") or "2400"),
+            int(os.environ.get("JUDGE_EVIDENCE_MAX_ITEM_CHARS", "900") or "900"),
+            int(os.environ.get("JUDGE_EVIDENCE_MAX_TOKENS", "0") or "0"),
+        )
 
     @staticmethod
     def _format_evidence(
@@ -159,140 +430,239 @@ class JudgeAgent:
         *,
         max_chars: int | None = None,
         max_item_chars: int | None = None,
+        max_tokens: int | None = None,
+        near_duplicates: bool = False,
     ) -> str:
+        return JudgeAgent._format_evidence_prefix(
+            evidence,
+            max_chars=max_chars,
+            max_item_chars=max_item_chars,
+            max_tokens=max_tokens,
+            near_duplicates=near_duplicates,
+        )[0]
+
+    def _format_evidence_cached(self, evidence: list, **budget: Any) -> str:
+        """_format_evidence, reusing the last result for a list that has only grown since.
+
+        Trials pass the same ever-growing evidence list every round. Once its leading
+        items exhaust the budget, appended items cannot change the block; items are
+        compared by identity, so replaced or reordered entries are reformatted.
+        """
+        key = (id(evidence), tuple(budget.items()))
+        items = evidence or ()
+        hit = self._evidence_fmt_cache.get(key)
+        if hit is not None:
+            prefix, exhausted, text = hit
+            if (exhausted or len(items) == len(prefix)) and len(items) >= len(prefix):
+                if all(a is b for a, b in zip(items, prefix)):
+                    return text
+        text, consumed = self._format_evidence_prefix(evidence, **budget)
+        if len(self._evidence_fmt_cache) >= _EVIDENCE_FMT_CACHE_SIZE:
+            self._evidence_fmt_cache.clear()
+        exhausted = consumed is not None
+        self._evidence_fmt_cache[key] = (tuple(items[:consumed] if exhausted else items), exhausted, text)
+        return text
+
+    @staticmethod
+    def _format_evidence_prefix(
+        evidence: list,
+        *,
+        max_chars: int | None = None,
+        max_item_chars: int | None = None,
+        max_tokens: int | None = None,
+        near_duplicates: bool = False,
+    ) -> tuple[str, int | None]:
+        """Format evidence; also return how many leading items filled the budget, or None."""
+
         def _truncate_sentence(text: str, limit: int) -> str:
             if len(text) <= limit:
                 return text
-            truncated = text[:limit]
-            last_period = truncated.rfind(".")
-            last_exclaim = truncated.rfind("!")
-            last_question = truncated.rfind("?")
-            cutoff = max(last_period, last_exclaim, last_question)
-            if cutoff > limit * 0.7:
-                return truncated[: cutoff + 1].rstrip() + " ...(truncated)"
+            # Only a boundary past 70% of the limit is accepted, so search just that
+            # window of the original text (no slice copy, no full-length scans)
+            start = int(limit * 0.7) + 1
+            cutoff = max(text.rfind(".", start, limit), text.rfind("!", start, limit), text.rfind("?", start, limit))
+            if cutoff != -1:
+                return text[: cutoff + 1].rstrip() + " ...(truncated)"
             return text[: limit - 15].rstrip() + " ...(truncated)"
 
+        def _normalized_head(raw: str, limit: int) -> str:
+            # Normalize whitespace to reduce prompt bloat; split() also drops edge whitespace.
+            # Normalizing a prefix yields a prefix of the normalized whole, so once the head
+            # exceeds the item limit the rest of a huge item never needs to be scanned
+            if limit <= 15:  # _truncate_sentence's fallback cut is then relative to the full length
+                return " ".join(raw.split())
+            k = 2 * limit
+            while True:
+                head = " ".join(raw[:k].split())
+                if len(head) > limit or k >= len(raw):
+                    return head
+                k *= 2
+
         max_chars = max_chars or int(os.environ.get("JUDGE_EVIDENCE_MAX_CHARS", "2400"))
         max_item_chars = max_item_chars or int(os.environ.get("JUDGE_EVIDENCE_MAX_ITEM_CHARS", "900"))
+        if max_tokens is None:
+            max_tokens = int(os.environ.get("JUDGE_EVIDENCE_MAX_TOKENS", "0") or "0")
 
-        items: list[str] = []
-        for i, e in enumerate(evidence or [], start=1):
-            if e is None:
-                continue
-            s = str(e).strip()
-            if not s:
-                continue
-            # Normalize whitespace to reduce prompt bloat
-            s = " ".join(s.split())
-            s = _truncate_sentence(s, max_item_chars)
-            items.append(f"[{i}] {s}")
+        # A token budget (when set and a local tokenizer is available) replaces the
+        # character budget; items are still pre-trimmed to max_item_chars either way
+        if max_tokens > 0 and tokenizer_available():
+            budget, sep_cost = max_tokens, 1  # "\n\n" is a single token
 
-        out = "\n\n".join(items).strip() or "(none)"
-        if len(out) <= max_chars:
-            return out
-
-        return _truncate_sentence(out, max_chars)
-
-    def _build_deliberation_prompt(
+            def cost(text: str) -> int:
+                n = count_tokens(text)
+                return len(text) if n is None else n
+        else:
+            budget, sep_cost, cost = max_chars, 2, len
+
+        def _fit(chunk: str, chunk_cost: int, remaining: int) -> str | None:
+            # Estimate the cut from the chunk's chars-per-token (exactly remaining on the
+            # character budget), then shrink until the truncated piece, marker included,
+            # fits; at 16 or less there is no room for text beside the marker
+            limit = len(chunk) * remaining // chunk_cost
+            while limit > 16:
+                piece = _truncate_sentence(chunk, limit)
+                if cost(piece) <= remaining:
+                    return piece
+                limit = int(limit * 0.9)
+            return None
+
+        consumed: int | None = None
+
+        def _chunks():
+            nonlocal consumed
+            # Track the running cost so items past the budget are never normalized/formatted
+            total = -sep_cost  # no separator before the first chunk
+            # Repeated claims spend budget without adding anything the Judge can weigh
+            seen: set[str] = set()
+            kept_shingles: list[set] = []
+            for i, e in enumerate(evidence or (), start=1):
+                if e is None:
+                    continue
+                s = _normalized_head(e if isinstance(e, str) else str(e), max_item_chars)
+                if not s:
+                    continue
+                body = _truncate_sentence(s, max_item_chars)
+                if body in seen:
+                    continue
+                seen.add(body)
+                if near_duplicates:
+                    shingles = _shingles(body)
+                    if any(_jaccard(shingles, k) > _NEAR_DUPLICATE_JACCARD for k in kept_shingles):
+                        continue
+                    kept_shingles.append(shingles)
+                chunk = f"[{i}] {body}"
+                chunk_cost = cost(chunk)
+                total += sep_cost + chunk_cost
+                if total > budget:
+                    consumed = i
+                    remaining = budget - (total - chunk_cost)
+                    if remaining > 0:
+                        piece = _fit(chunk, chunk_cost, remaining)
+                        if piece:
+                            yield piece
+                    return
+                yield chunk
+
+        text = "\n\n".join(_chunks()).strip() or "(none)"
+        return text, consumed
+
+    async def _build_deliberation_prompt(
         self,
         topic: str,
         positive_evidence: list,
         negative_evidence: list,
         round_number: int,
     ) -> str:
-        t = (topic or "").strip() or "(unknown topic)"
-
-        pos_block = self._format_evidence(positive_evidence)
-        neg_block = self._format_evidence(negative_evidence)
-
-        rn = int(round_number) if isinstance(round_number, int) else 0
-        
-        is_final_round = rn >= self.max_rounds
-        
-        prompt = (
-            f"TOPIC: {t}\n\n"
-            "EVIDENCE FROM THE ADMIRER (POSITIVE):\n"
-            f"{pos_block}\n\n"
-            "EVIDENCE FROM THE CRITIC (NEGATIVE):\n"
-            f"{neg_block}\n\n"
-            f"CURRENT ROUND: {rn} of {self.max_rounds}\n\n"
+        t = topic or "(unknown topic)"  # pre-stripped by deliberate
+
+        # Formatting is pure Python over up to several KB per side; run both sides off
+        # the event loop so concurrent trials/agents stay responsive meanwhile
+        max_chars, max_item_chars, max_tokens = self._evidence_budget
+        budget = {
+            "max_chars": max_chars,
+            "max_item_chars": max_item_chars,
+            "max_tokens": max_tokens,
+            "near_duplicates": self._dedup_evidence,
+        }
+        pos_block, neg_block = await asyncio.gather(
+            asyncio.to_thread(self._format_evidence_cached, positive_evidence, **budget),
+            asyncio.to_thread(self._format_evidence_cached, negative_evidence, **budget),
         )
-        
-        if is_final_round:
-            prompt += (
-                "🚨 FINAL ROUND ALERT 🚨\n"
-                "This is the FINAL round. You are PROHIBITED from requesting more evidence.\n"
-                "You MUST call the `exit_loop` tool now.\n"
-                "Render your verdict based on whatever evidence you have, even if imperfect.\n"
-                "Do NOT provide feedback. Do NOT ask for queries. CALL `exit_loop` IMMEDIATELY.\n"
-            )
-        else:
-            prompt += (
-                "Deliberate carefully.\n"
-                "- If evidence is sufficient and balanced, call exit_loop.\n"
-                "- If evidence is insufficient, provide specific feedback for the next round.\n"
-            )
 
-        return prompt
+        rn = int(round_number) if isinstance(round_number, int) else 0
+        directives = self._directive_by_round
+        directive = directives[rn] if 0 <= rn < len(directives) else _round_directive(rn, self.max_rounds)
+
+        return "".join((
+            "TOPIC: ", t, "\n\n",
+            "EVIDENCE FROM THE ADMIRER (POSITIVE):\n",
+            pos_block, "\n\n",
+            "EVIDENCE FROM THE CRITIC (NEGATIVE):\n",
+            neg_block, "\n\n",
+            directive,
+        ))
+
+    def _session_id_for_round(self, round_number: int, stateful_id: str | None = None) -> str:
+        """Return a session_id for this deliberation call.
 
-    @staticmethod
-    def _is_resource_exhausted(err: Exception) -> bool:
-        """Detect Google ADK/GenAI rate limit (429) errors robustly.
-        
-        Walks exception chain to catch:
-        - google.adk.models.google_llm._ResourceExhaustedError (ADK wrapper)
-        - google.genai.errors.ClientError with status 429
-        - Any exception containing "RESOURCE_EXHAUSTED" or "429"
+        By default this is *stateless* (a fresh, empty session per call) to avoid runaway
+        context growth. Ids are drawn from a small pool and handed back, emptied, by
+        _release_session_id; an id is never shared by concurrent calls.
+        Set ADK_STATEFUL_SESSIONS=1 to keep a stable session (stateful_id, else the
+        Judge's own) across rounds.
         """
-        # Walk exception chain
-        current = err
-        while current is not None:
-            # Check class name for Google ADK specific errors
-            cls_name = current.__class__.__name__
-            module_name = current.__class__.__module__
-            
-            # Check for Google ADK ResourceExhaustedError
-            if cls_name == "_ResourceExhaustedError" and "google.adk.models.google_llm" in module_name:
-                return True
-            
-            # Check for Google GenAI ClientError with status 429
-            if cls_name == "ClientError" and "google.genai.errors" in module_name:
-                # Check if it's a 429 error
-                err_str = str(current).upper()
-                if "429" in err_str or "RESOURCE_EXHAUSTED" in err_str:
-                    return True
-            
-            # Check error message for common patterns
-            msg = str(current).upper()
-            if "RESOURCE_EXHAUSTED" in msg or "429" in msg:
-                return True
-            
-            # Move to __cause__ or __context__
-            if hasattr(current, "__cause__") and current.__cause__:
-                current = current.__cause__
-            elif hasattr(current, "__context__") and current.__context__:
-                current = current.__context__
-            else:
-                break
-        
-        return False
+        if self._stateful_sessions:
+            return stateful_id or self.session_id
+        try:
+            return self._session_pool.popleft()
+        except IndexError:
+            return f"{self.session_id}_{uuid.uuid4().hex[:8]}"
+
+    async def _release_session_id(self, session_id: str) -> None:
+        """Drop a per-call session's history and return its id to the pool."""
+        if self._stateful_sessions:
+            return
+        await discard_session(self.runner, user_id=self.user_id, session_id=session_id)
+        if len(self._session_pool) < (self._session_pool.maxlen or 0):
+            self._session_pool.append(session_id)
+
+    async def deliberate_many(
+        self,
+        cases: list[tuple[str, list, list, int]],
+        *,
+        max_concurrency: int = 16,
+    ) -> list[JudgeDecision | BaseException]:
+        """Deliberate several independent trials concurrently, bounded by a semaphore.
 
-    def _session_id_for_round(self, round_number: int) -> str:
-        """Return a session_id for this deliberation call.
+        Args:
+            cases: (topic, positive_evidence, negative_evidence, round_number) per trial
+            max_concurrency: Maximum number of in-flight deliberations
 
-        By default this is *stateless* (unique per call) to avoid runaway context growth.
-        Set ADK_STATEFUL_SESSIONS=1 to keep a stable session across rounds.
+        Returns:
+            A decision per case in input order; failures are returned as the
+            exception rather than aborting the batch
         """
-        stateful = (os.environ.get("ADK_STATEFUL_SESSIONS", "0") or "0").strip().lower() in {
-            "1",
-            "true",
-            "yes",
-            "y",
-        }
-        if stateful:
-            return self.session_id
-        rn = int(round_number) if isinstance(round_number, int) else 0
-        return f"{self.session_id}_r{rn}_{uuid.uuid4().hex[:8]}"
+        sem = asyncio.Semaphore(max(1, max_concurrency))
+        # Cases are independent trials; with stateful sessions each needs its own history,
+        # which is one-shot here and is deleted once the batch is done
+        case_sessions = (
+            [f"{self.session_id}_case{i}_{uuid.uuid4().hex[:8]}" for i in range(len(cases))]
+            if self._stateful_sessions
+            else [None] * len(cases)
+        )
+
+        async def _bounded(case: tuple[str, list, list, int], session_id: str | None) -> JudgeDecision:
+            async with sem:
+                return await self.deliberate(*case, session_id=session_id)
+
+        try:
+            return await asyncio.gather(
+                *(_bounded(case, sid) for case, sid in zip(cases, case_sessions)), return_exceptions=True
+            )
+        finally:
+            for sid in case_sessions:
+                if sid is not None:
+                    await discard_session(self.runner, user_id=self.user_id, session_id=sid)
 
     async def deliberate(
         self,
@@ -300,50 +670,127 @@ class JudgeAgent:
         positive_evidence: list,
         negative_evidence: list,
         round_number: int,
+        *,
+        session_id: str | None = None,
     ) -> JudgeDecision:
-        prompt = self._build_deliberation_prompt(topic, positive_evidence, negative_evidence, round_number)
+        """Weigh both sides' evidence and return the Judge's decision for this round.
+
+        session_id names the stateful session to continue instead of the Judge's own;
+        it is only used with ADK_STATEFUL_SESSIONS=1.
+        """
+        stateful_id = session_id
+        topic_s = (topic or "").strip()
+        debug = logger.isEnabledFor(logging.DEBUG)
+
+        # A side with no evidence is always sent back before the final round; decide that
+        # here instead of paying a model round-trip for the foregone rejection
+        final_round = round_number >= self.max_rounds
+        if not final_round or self._shortcircuit_empty:
+            missing = [
+                side
+                for side, evidence in (("Admirer", positive_evidence), ("Critic", negative_evidence))
+                if not any(e is not None and str(e).strip() for e in evidence or ())
+            ]
+            if final_round and len(missing) == 2:
+                # Opt-in (JUDGE_SHORTCIRCUIT_EMPTY=1): nothing to weigh at the final round
+                logger.info(
+                    "Judge concluded without deliberation (no evidence at final round)",
+                    extra={"topic": topic_s, "round_number": round_number},
+                )
+                return JudgeDecision(
+                    accepted=True,
+                    verdict="No admissible evidence was presented; trial concluded without a substantive verdict.",
+                    confidence="low (forced)",
+                    summary={"reason": "empty evidence at final round"},
+                )
+            if missing and not final_round:
+                logger.info(
+                    "Judge rejected without deliberation (empty evidence side)",
+                    extra={"topic": topic_s, "round_number": round_number, "missing": missing},
+                )
+                return JudgeDecision(
+                    accepted=False,
+                    feedback=" ".join(
+                        f"The {side} has presented no evidence yet; provide 2-3 concrete, verifiable facts."
+                        for side in missing
+                    ),
+                )
 
-        max_attempts = int(os.environ.get("ADK_JUDGE_RETRIES", "3") or "3")
-        base_delay = float(os.environ.get("ADK_JUDGE_RETRY_BASE_SECONDS", "1.5") or "1.5")
+        # Identical inputs (replays, retried rounds) yield the same decision; skip the LLM
+        cache_key = _decision_cache_key(
+            topic_s, positive_evidence, negative_evidence, round_number, self.max_rounds, self.model
+        )
+        cached = _cached_decision(cache_key) if self._decision_cache_size > 0 else None
+        if cached is not None:
+            if debug:
+                logger.debug("Judge decision cache hit", extra={"topic": topic_s, "round_number": round_number})
+            return cached
+
+        prompt = await self._build_deliberation_prompt(topic_s, positive_evidence, negative_evidence, round_number)
+
+        max_attempts, base_delay, timeout = self._max_attempts, self._base_delay, self._timeout
 
         last_error: Exception | None = None
+        rate_limited = False
         for attempt in range(max_attempts):
             try:
-                self.agent.instruction = JUDGE_SYSTEM_PROMPT.format(round_count=round_number, max_rounds=self.max_rounds)
-                session_id = self._session_id_for_round(round_number)
-                logger.debug(
-                    "Judge deliberation start",
-                    extra={
-                        "topic": (topic or "").strip(),
-                        "round_number": round_number,
-                        "pos_items": len(positive_evidence or []),
-                        "neg_items": len(negative_evidence or []),
-                        "prompt_chars": len(prompt),
-                        "session_id": session_id,
-                    },
-                )
-                events = await self.runner.run_debug(
-                    prompt,
-                    user_id=self.user_id,
-                    session_id=session_id,
-                    quiet=True,
-                )
+                session_id = self._session_id_for_round(round_number, stateful_id)
+                if debug:
+                    logger.debug(
+                        "Judge deliberation start",
+                        extra={
+                            "topic": topic_s,
+                            "round_number": round_number,
+                            "pos_items": len(positive_evidence or []),
+                            "neg_items": len(negative_evidence or []),
+                            "prompt_chars": len(prompt),
+                            "session_id": session_id,
+                        },
+                    )
+                # Bound each attempt so a hung call is retried instead of eating the budget;
+                # time spent queued for a fleet slot does not count against the timeout
+                slot = _judge_slot(self._max_concurrency)
+                try:
+                    async with slot if slot is not None else contextlib.nullcontext():
+                        events = await asyncio.wait_for(
+                            run_until_tool_response(
+                                self.runner,
+                                prompt,
+                                user_id=self.user_id,
+                                session_id=session_id,
+                                tool_name="exit_loop",
+                            ),
+                            timeout=timeout,
+                        )
+                finally:
+                    # Per-call sessions are never resumed; empty them so the pooled
+                    # runner's in-memory store stays constant-size across rounds
+                    await self._release_session_id(session_id)
                 last_error = None
                 break
 
             except Exception as e:
                 last_error = e
-                if self._is_resource_exhausted(e) and attempt < max_attempts - 1:
-                    # Improved backoff for rate limiting errors
-                    # Base delay: longer for 429 errors (3 seconds) vs default (1.5 seconds)
-                    rate_limit_base = 3.0  # seconds for 429 errors
-                    # Exponential backoff: rate_limit_base * 2^attempt
-                    exp_delay = rate_limit_base * (2 ** attempt)
-                    # Add jitter: random factor between 0.5 and 1.5
-                    jitter = 0.5 + random.random()  # 0.5 to 1.5
-                    delay = exp_delay * jitter
-                    # Cap at 30 seconds
-                    delay = min(delay, 30.0)
+                if isinstance(e, asyncio.TimeoutError) and attempt < max_attempts - 1:
+                    delay = base_delay * (2 ** attempt)
+                    logger.warning(
+                        "Judge deliberation timed out, retrying after backoff",
+                        extra={
+                            "attempt": attempt + 1,
+                            "max_attempts": max_attempts,
+                            "timeout_seconds": timeout,
+                            "delay_seconds": round(delay, 2),
+                        },
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                # Classified once; the failure message below reuses this for the last error
+                rate_limited = is_resource_exhausted(e)
+                if rate_limited and attempt < max_attempts - 1:
+                    # Exponential 429 backoff from the precomputed table, jittered by
+                    # 0.5-1.5x and capped at 30 seconds
+                    base = _RATE_LIMIT_BACKOFF[min(attempt, len(_RATE_LIMIT_BACKOFF) - 1)]
+                    delay = min(base * random.uniform(0.5, 1.5), _RATE_LIMIT_MAX_DELAY)
                     logger.warning(
                         "Judge rate limit (429) detected, retrying after backoff",
                         extra={
@@ -358,24 +805,16 @@ class JudgeAgent:
                 break
 
         if last_error is not None:
+            error_text = str(last_error)
             logger.error(
                 "Judge deliberation failed",
                 exc_info=last_error,
-                extra={"topic": (topic or "").strip(), "error": str(last_error), "round_number": round_number},
+                extra={"topic": topic_s, "error": error_text, "round_number": round_number},
             )
 
-            expose = (os.environ.get("EXPOSE_JUDGE_INTERNAL_ERRORS", "0") or "0").strip().lower() in {
-                "1",
-                "true",
-                "yes",
-                "y",
-            }
-            extra_msg = f" ({type(last_error).__name__}: {last_error})" if expose else ""
+            extra_msg = f" ({type(last_error).__name__}: {error_text})" if self._expose_internal_errors else ""
 
-            # Determine if this is a rate limit error
-            is_rate_limit = self._is_resource_exhausted(last_error)
-            
-            if is_rate_limit:
+            if rate_limited:
                 feedback_msg = (
                     "The Judge could not deliberate because the AI model quota/rate limit was exceeded." + extra_msg + " "
                     "This is a temporary service limitation; please try again in a few moments."
@@ -391,12 +830,20 @@ class JudgeAgent:
                 feedback=feedback_msg,
             )
 
-        tool_result = extract_tool_result(events, "exit_loop")
+        decision = self._decision_from_events(topic_s, round_number, events)
+        _cache_decision(cache_key, decision, self._decision_cache_size)
+        return decision
+
+    def _decision_from_events(self, topic: str, round_number: int, events: Any) -> JudgeDecision:
+        """Turn a completed deliberation's events into an accept or reject decision (topic pre-stripped)."""
+        # One pass yields both; the reply text is only used when exit_loop was not called
+        tool_result, text_output = scan_events(events, "exit_loop")
         if tool_result is None:
-            logger.debug(
-                "Judge produced no exit_loop tool part (no function_call/response found)",
-                extra={"topic": (topic or "").strip(), "round_number": round_number},
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Judge produced no exit_loop tool part (no function_call/response found)",
+                    extra={"topic": topic, "round_number": round_number},
+                )
             # FORCE VERDICT ON FINAL ROUND
             # If the model refused to call exit_loop even when told to, we force it here.
             # This handles cases where the model writes a verdict in text but forgets the tool call,
@@ -406,7 +853,6 @@ class JudgeAgent:
                     "Judge failed to call exit_loop in final round. Forcing verdict from text output.",
                     extra={"topic": topic, "round_number": round_number}
                 )
-                text_output = (extract_text(events) or "").strip()
                 return JudgeDecision(
                     accepted=True,
                     verdict=text_output if text_output else "The Judge failed to render a formal verdict but the trial has concluded.",
@@ -414,46 +860,16 @@ class JudgeAgent:
                     summary={"reason": "Max rounds reached, forced conclusion"},
                 )
 
-            feedback = (extract_text(events) or "").strip()
+            feedback = text_output
             if not feedback:
                 feedback = "Insufficient evidence formatting/quality. Provide 2-3 concrete, verifiable facts per side."
 
-            # Parse suggested queries from feedback
-            import re
-            
-            admirer_queries = []
-            critic_queries = []
-            
-            # Simple parsing of bullet points under headers
-            lines = feedback.split('\n')
-            current_section = None
-            
-            for line in lines:
-                line = line.strip()
-                if "SUGGESTED QUERIES FOR ADMIRER" in line.upper():
-                    current_section = "admirer"
-                    continue
-                elif "SUGGESTED QUERIES FOR CRITIC" in line.upper():
-                    current_section = "critic"
-                    continue
-                elif line.upper().startswith("SUGGESTED QUERIES"):
-                    current_section = None # reset if ambiguous header
-                
-                if current_section and (line.startswith('-') or line.startswith('*') or line[0:1].isdigit()):
-                    # Extract query from quotes if present, otherwise whole line
-                    match = re.search(r'["\']([^"\']+)["\']', line)
-                    query = match.group(1) if match else re.sub(r'^[-*0-9.)\s]+', '', line).strip()
-                    
-                    if query:
-                        if current_section == "admirer":
-                            admirer_queries.append(query)
-                        elif current_section == "critic":
-                            critic_queries.append(query)
+            admirer_queries, critic_queries = _parse_suggested_queries(feedback)
 
             logger.info(
                 "Judge rejected (no exit_loop tool call)",
                 extra={
-                    "topic": (topic or "").strip(),
+                    "topic": topic,
                     "round_number": round_number,
                     "admirer_suggestions": len(admirer_queries),
                     "critic_suggestions": len(critic_queries)
@@ -466,27 +882,15 @@ class JudgeAgent:
                 suggested_queries_critic=critic_queries
             )
 
-        verdict = (tool_result.get("verdict") if isinstance(tool_result, dict) else "") or ""
-        confidence = (tool_result.get("confidence") if isinstance(tool_result, dict) else "") or ""
-        summary = (tool_result.get("summary") if isinstance(tool_result, dict) else None)
-
-        verdict = str(verdict).strip()
-        confidence = str(confidence).strip()
-
-        # Allow "FORCED" values or standard levels
-        if confidence and confidence.lower() not in {"low", "medium", "high"} and not confidence.startswith("FORCED"):
-            confidence = ""
+        verdict, confidence, summary_out = _parse_tool_result(tool_result)
 
         if not verdict or not confidence:
-            raw = ""
-            try:
-                raw = json.dumps(tool_result, ensure_ascii=False)[:800]
-            except Exception:
-                raw = str(tool_result)[:800]
+            # Log-only preview; repr needs no second serializer and cannot fail on odd values
+            raw = repr(tool_result)[:800]
 
             logger.warning(
                 "Judge produced malformed exit_loop call; treating as rejection",
-                extra={"topic": (topic or "").strip(), "round_number": round_number, "tool_args": raw},
+                extra={"topic": topic, "round_number": round_number, "tool_args": raw},
             )
 
             feedback = (
@@ -496,13 +900,9 @@ class JudgeAgent:
             )
             return JudgeDecision(accepted=False, feedback=feedback)
 
-        summary_out: Dict[str, Any] | None = None
-        if isinstance(summary, dict):
-            summary_out = summary
-
         logger.info(
             "Judge accepted via exit_loop",
-            extra={"topic": (topic or "").strip(), "round_number": round_number, "confidence": confidence},
+            extra={"topic": topic, "round_number": round_number, "confidence": confidence},
         )
 
         return JudgeDecision(
@@ -15,10 +15,12 @@ import re
 import sys
 import logging
 import hashlib
+import json
 from datetime import datetime
 from typing import Optional
 
 from google.genai import types
+from rich.console import Console
 
 from utils.state import CourtState, TrialStatus
 from utils.display import TrialDisplay
@@ -71,7 +73,51 @@ OUTPUT_DIR = "output"
 API_KEY_ENV = "GOOGLE_API_KEY"  # or "GEMINI_API_KEY"
 MODEL_NAME = get_model_name()
 SHOW_STEPS = True
-ENABLE_PARALLEL = False
+# Overall cap per agent per round, so one hung provider cannot stall the other side's results
+RESEARCH_TIMEOUT_SECONDS = float(os.environ.get("RESEARCH_TIMEOUT_SECONDS", "120") or "120")
+# Start the next round's research while the Judge deliberates. The speculative round
+# researches with the feedback it started from, so the Judge's new feedback takes
+# effect one round later; off by default for that reason.
+PIPELINE_RESEARCH = (get_env("PIPELINE_RESEARCH", "0") or "0").lower() in {"1", "true", "yes", "y"}
+
+
+# Placeholder findings for a side whose research failed; never recorded as evidence
+POS_ERROR_EVIDENCE = "Error gathering positive evidence"
+NEG_ERROR_EVIDENCE = "Error gathering critical evidence"
+
+
+async def debate_round(
+    admirer: AdmirerAgent,
+    critic: CriticAgent,
+    topic: str,
+    feedback: str = "",
+    *,
+    used_queries_admirer: list[str] = None,
+    used_queries_critic: list[str] = None,
+    suggested_queries_admirer: list[str] = None,
+    suggested_queries_critic: list[str] = None,
+) -> list:
+    """
+    Run one research round for both sides concurrently.
+
+    Both agents are network-bound (LLM query generation + search), so their
+    round-trips overlap and the round costs max(admirer, critic) instead of the sum.
+    Each side is bounded by RESEARCH_TIMEOUT_SECONDS.
+
+    Returns:
+        List of [admirer_result, critic_result]; either entry may be an Exception.
+    """
+    return await asyncio.gather(
+        asyncio.wait_for(
+            admirer.research_with_query(topic, feedback, used_queries_admirer, suggested_queries_admirer),
+            timeout=RESEARCH_TIMEOUT_SECONDS,
+        ),
+        asyncio.wait_for(
+            critic.research_with_query(topic, feedback, used_queries_critic, suggested_queries_critic),
+            timeout=RESEARCH_TIMEOUT_SECONDS,
+        ),
+        return_exceptions=True,  # Don't fail if one agent fails
+    )
 
 
 async def run_parallel_research(
@@ -102,44 +148,57 @@ async def run_parallel_research(
     Returns:
         Tuple of (admirer_query, admirer_findings, critic_query, critic_findings)
     """
-    if ENABLE_PARALLEL:
-        # Use asyncio.gather to run both concurrently
-        admirer_task = admirer.research_with_query(topic, feedback, used_queries_admirer, suggested_queries_admirer)
-        critic_task = critic.research_with_query(topic, feedback, used_queries_critic, suggested_queries_critic)
-
-        admirer_result, critic_result = await asyncio.gather(
-            admirer_task,
-            critic_task,
-            return_exceptions=True,  # Don't fail if one agent fails
-        )
-    else:
-        admirer_result = await admirer.research_with_query(
-            topic, feedback, used_queries_admirer, suggested_queries_admirer
-        )
-        critic_result = await critic.research_with_query(
-            topic, feedback, used_queries_critic, suggested_queries_critic
-        )
+    admirer_result, critic_result = await debate_round(
+        admirer,
+        critic,
+        topic,
+        feedback,
+        used_queries_admirer=used_queries_admirer,
+        used_queries_critic=used_queries_critic,
+        suggested_queries_admirer=suggested_queries_admirer,
+        suggested_queries_critic=suggested_queries_critic,
+    )
 
     # Handle exceptions gracefully
     if isinstance(admirer_result, Exception):
-        logger.info(f"Admirer failed: {admirer_result}")
-        admirer_result = ("", "Error gathering positive evidence")
+        logger.info(f"Admirer failed: {admirer_result!r}")
+        admirer_result = ("", POS_ERROR_EVIDENCE)
 
     if isinstance(critic_result, Exception):
-        logger.info(f"Critic failed: {critic_result}")
-        critic_result = ("", "Error gathering critical evidence")
+        logger.info(f"Critic failed: {critic_result!r}")
+        critic_result = ("", NEG_ERROR_EVIDENCE)
 
     admirer_query, admirer_findings = admirer_result
     critic_query, critic_findings = critic_result
     return admirer_query, admirer_findings, critic_query, critic_findings
 
 
+# Line-anchored "Page:" headers, one per Wikipedia result in a findings block
+_PAGE_RE = re.compile(r"^Page:\s+", re.MULTILINE)
+# First "Page: <title>" header in a Wikipedia findings block
+_PAGE_TITLE_RE = re.compile(r"Page:\s*(.*?)\n")
+# Characters that are not str.isalnum() (the same set for every code point), for filenames
+_SLUG_UNSAFE_RE = re.compile(r"[\W_]")
+_FILE_TIMESTAMP_TABLE = str.maketrans({"-": None, ":": None, " ": "_"})
+
+
 def _count_pages(text: str) -> int:
-    return len(re.findall(r"^Page:\s+", text or "", flags=re.MULTILINE))
+    return sum(1 for _ in _PAGE_RE.finditer(text or ""))
+
+
+async def _cancel_task(task: asyncio.Task) -> None:
+    """Cancel a task and wait for it to finish, discarding its result or error."""
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+def _usable_evidence(evidence: str) -> bool:
+    return bool(evidence) and not evidence.isspace() and evidence not in (POS_ERROR_EVIDENCE, NEG_ERROR_EVIDENCE)
 
 
 def _evidence_hash(evidence: str) -> str:
-    return hashlib.md5(evidence.encode()).hexdigest()
+    # 128-bit BLAKE2b like the Judge's cache keys: faster than MD5 in hashlib
+    return hashlib.blake2b(evidence.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
 
 
 def save_verdict(
@@ -161,61 +220,89 @@ def save_verdict(
 
     now = datetime.now()
     timestamp = now.strftime("%Y-%m-%d %H:%M:%S")
-    file_timestamp = now.strftime("%Y%m%d_%H%M%S")
-    safe_topic = "".join(c if c.isalnum() else "_" for c in topic.lower())
+    # "YYYYmmdd_HHMMSS" derived from the same formatted string
+    file_timestamp = timestamp.translate(_FILE_TIMESTAMP_TABLE)
+    safe_topic = _SLUG_UNSAFE_RE.sub("_", topic.lower())
     filename = f"verdict_{safe_topic}_{file_timestamp}.txt"
     path = os.path.join(OUTPUT_DIR, filename)
 
-    pos_summary = (
-        "\n\n".join(state.pos_data)
-        if state.pos_data
-        else "(No positive evidence gathered)"
-    )
-    neg_summary = (
-        "\n\n".join(state.neg_data)
-        if state.neg_data
-        else "(No negative evidence gathered)"
-    )
-
     confidence_str = ""
     summary_str = ""
 
     if decision:
-        if hasattr(decision, "confidence") and decision.confidence:
-            confidence_str = f"Confidence Score: {decision.confidence}\n"
-
-        if hasattr(decision, "summary") and decision.summary:
-            import json
-
-            summary_str = f"Key Factors:\n{json.dumps(decision.summary, indent=2)}\n"
-
-    content = f"""================================================================
-THE HISTORICAL COURT - VERDICT
-================================================================
-Topic: {topic}
-Date: {timestamp}
-Rounds: {state.rounds}
-{confidence_str}================================================================
-
-THE ADMIRER'S CASE:
-{pos_summary}
-
-THE CRITIC'S CASE:
-{neg_summary}
-
-FINAL VERDICT:
-{verdict}
-
-{summary_str}================================================================
-"""
-
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(content)
+        confidence = getattr(decision, "confidence", None)
+        if confidence:
+            confidence_str = f"Confidence Score: {confidence}\n"
+
+        summary = getattr(decision, "summary", None)
+        if summary:
+            summary_str = f"Key Factors:\n{json.dumps(summary, indent=2)}\n"
+
+    def _case(evidence: list[str], empty: str):
+        # Evidence can be many KB per round; write items directly instead of joining them
+        if not evidence:
+            yield empty
+            return
+        yield evidence[0]
+        for item in evidence[1:]:
+            yield "\n\n"
+            yield item
+
+    with open(path, "w", encoding="utf-8", buffering=65536) as f:
+        f.write(
+            "================================================================\n"
+            "THE HISTORICAL COURT - VERDICT\n"
+            "================================================================\n"
+            f"Topic: {topic}\n"
+            f"Date: {timestamp}\n"
+            f"Rounds: {state.rounds}\n"
+            f"{confidence_str}================================================================\n"
+            "\n"
+            "THE ADMIRER'S CASE:\n"
+        )
+        f.writelines(_case(state.pos_data, "(No positive evidence gathered)"))
+        f.write("\n\nTHE CRITIC'S CASE:\n")
+        f.writelines(_case(state.neg_data, "(No negative evidence gathered)"))
+        f.write(
+            "\n\nFINAL VERDICT:\n"
+            f"{verdict}\n"
+            "\n"
+            f"{summary_str}================================================================\n"
+        )
 
     logger.info(f"Verdict saved to {path}")
     return path
 
 
+# Agents per (model name, AFC limit), reused across trials in one process; each entry
+# also holds the model object it was built with, so a different model rebuilds
+_AGENT_CACHE: dict[tuple, tuple[object, tuple[AdmirerAgent, CriticAgent, JudgeAgent]]] = {}
+
+
+def _trial_agents(
+    model: object, afc_max: str | None, generate_content_config: types.GenerateContentConfig | None
+) -> tuple[AdmirerAgent, CriticAgent, JudgeAgent]:
+    """Return warm Admirer/Critic/Judge agents for this configuration, building them once."""
+    key = (MODEL_NAME, afc_max)
+    cached = _AGENT_CACHE.get(key)
+    if cached is not None and cached[0] is model:
+        return cached[1]
+
+    agents = (
+        AdmirerAgent(model=model, generate_content_config=generate_content_config),
+        CriticAgent(model=model, generate_content_config=generate_content_config),
+        JudgeAgent(
+            model=model,
+            max_rounds=MAX_ROUNDS,
+            generate_content_config=generate_content_config,
+        ),
+    )
+    # A stateful Judge session carries one trial's history, so it must not be shared
+    if not agents[2].stateful_sessions:
+        _AGENT_CACHE[key] = (model, agents)
+    return agents
+
+
 async def run_trial(topic: str, *, model: object) -> str:
     """
     Execute the complete trial workflow.
@@ -251,57 +338,55 @@ async def run_trial(topic: str, *, model: object) -> str:
                 extra={"value": afc_max},
             )
 
-    admirer = AdmirerAgent(model=model, generate_content_config=generate_content_config)
-    critic = CriticAgent(model=model, generate_content_config=generate_content_config)
-    judge = JudgeAgent(
-        model=model,
-        max_rounds=MAX_ROUNDS,
-        generate_content_config=generate_content_config,
-    )
+    admirer, critic, judge = _trial_agents(model, afc_max, generate_content_config)
 
     # 2. The Trial Loop
+    research_task: asyncio.Task | None = None
     while state.can_continue():
         state.increment_round()
         state.update_status(TrialStatus.RESEARCHING)
 
-        display.show_round_start(state.rounds, MAX_ROUNDS)
+        with display.batch():
+            display.show_round_start(state.rounds, MAX_ROUNDS)
 
-        if state.feedback:
-            display.show_judge_deliberation(
-                f"Feedback for next round: {state.feedback}"
-            )
+            if state.feedback:
+                display.show_judge_deliberation(
+                    f"Feedback for next round: {state.feedback}"
+                )
 
         logger.info(f"=== Round {state.rounds} ===")
 
         # 3. Parallel Research (THE KEY ASYNC PATTERN)
         with display.progress_spinner("Agents are investigating...") as status:
-            display.show_agent_action(
-                "Admirer", "Searching for positive evidence...", is_loading=True
-            )
-            display.show_agent_action(
-                "Critic", "Searching for critical evidence...", is_loading=True
-            )
-
-            adm_query, pos_evidence, crit_query, neg_evidence = (
-                await run_parallel_research(
-                    admirer,
-                    critic,
-                    topic,
-                    state.feedback,
-                    state.used_queries_admirer,
-                    state.used_queries_critic,
-                    state.suggested_queries_admirer,
-                    state.suggested_queries_critic,
+            with display.batch():
+                display.show_agent_action(
+                    "Admirer", "Searching for positive evidence...", is_loading=True
                 )
+                display.show_agent_action(
+                    "Critic", "Searching for critical evidence...", is_loading=True
+                )
+
+            # A round started during the last deliberation (PIPELINE_RESEARCH) is reused
+            research = research_task or run_parallel_research(
+                admirer,
+                critic,
+                topic,
+                state.feedback,
+                state.used_queries_admirer,
+                state.used_queries_critic,
+                state.suggested_queries_admirer,
+                state.suggested_queries_critic,
             )
+            research_task = None
+            adm_query, pos_evidence, crit_query, neg_evidence = await research
 
-        display.show_evidence("Admirer", adm_query or "(no query)", pos_evidence)
-        display.show_evidence("Critic", crit_query or "(no query)", neg_evidence)
+        with display.batch():
+            display.show_evidence("Admirer", adm_query or "(no query)", pos_evidence)
+            display.show_evidence("Critic", crit_query or "(no query)", neg_evidence)
 
         # Extract titles from evidence if possible (assuming "Page: Title" format)
-        import re
-        adm_title_match = re.search(r"Page:\s*(.*?)\n", pos_evidence)
-        crit_title_match = re.search(r"Page:\s*(.*?)\n", neg_evidence)
+        adm_title_match = _PAGE_TITLE_RE.search(pos_evidence)
+        crit_title_match = _PAGE_TITLE_RE.search(neg_evidence)
         
         adm_title = adm_title_match.group(1).strip() if adm_title_match else ""
         crit_title = crit_title_match.group(1).strip() if crit_title_match else ""
@@ -312,9 +397,12 @@ async def run_trial(topic: str, *, model: object) -> str:
         if crit_query:
             state.used_queries_critic.append(crit_query)
 
-        pos_hash = _evidence_hash(pos_evidence)
+        # Failed or empty findings are neither hashed nor recorded
+        pos_hash = _evidence_hash(pos_evidence) if _usable_evidence(pos_evidence) else None
         # Check if title seen (if found) OR hash seen
-        if pos_hash not in state.evidence_hashes:
+        if pos_hash is None:
+            logger.info("Skipping failed/empty positive evidence")
+        elif pos_hash not in state.evidence_hashes:
             if adm_title and adm_title in state.seen_titles_admirer:
                  logger.info(f"Skipping duplicate positive title: {adm_title}")
             else:
@@ -323,8 +411,10 @@ async def run_trial(topic: str, *, model: object) -> str:
         else:
             logger.info("Skipping duplicate positive evidence (hash match)")
 
-        neg_hash = _evidence_hash(neg_evidence)
-        if neg_hash not in state.evidence_hashes:
+        neg_hash = _evidence_hash(neg_evidence) if _usable_evidence(neg_evidence) else None
+        if neg_hash is None:
+            logger.info("Skipping failed/empty negative evidence")
+        elif neg_hash not in state.evidence_hashes:
             if crit_title and crit_title in state.seen_titles_critic:
                  logger.info(f"Skipping duplicate negative title: {crit_title}")
             else:
@@ -333,39 +423,65 @@ async def run_trial(topic: str, *, model: object) -> str:
         else:
             logger.info("Skipping duplicate negative evidence (hash match)")
 
-        # 5. Judge Deliberation
-        state.update_status(TrialStatus.DELIBERATING)
-        with display.progress_spinner("Judge is deliberating...") as status:
-            display.show_agent_action(
-                "Judge", "Reviewing evidence and forming verdict...", is_loading=True
-            )
-            decision = await judge.deliberate(
-                topic=topic,
-                positive_evidence=state.pos_data,
-                negative_evidence=state.neg_data,
-                round_number=state.rounds,
+        # 5. Judge Deliberation (optionally overlapped with the next round's research)
+        if PIPELINE_RESEARCH and state.rounds < MAX_ROUNDS:
+            research_task = asyncio.create_task(
+                run_parallel_research(
+                    admirer,
+                    critic,
+                    topic,
+                    state.feedback,
+                    list(state.used_queries_admirer),
+                    list(state.used_queries_critic),
+                    list(state.suggested_queries_admirer),
+                    list(state.suggested_queries_critic),
+                )
             )
+        # The prefetched round is kept only for the next loop iteration; any other exit
+        # (acceptance, an error in deliberation or a state update) cancels it
+        reuse_research = False
+        try:
+            state.update_status(TrialStatus.DELIBERATING)
+            with display.progress_spinner("Judge is deliberating...") as status:
+                display.show_agent_action(
+                    "Judge", "Reviewing evidence and forming verdict...", is_loading=True
+                )
+                decision = await judge.deliberate(
+                    topic=topic,
+                    positive_evidence=state.pos_data,
+                    negative_evidence=state.neg_data,
+                    round_number=state.rounds,
+                )
 
-        # 6. Check Decision
-        if decision.accepted:
-            display.show_agent_action("Judge", "Verdict reached!", is_loading=False)
-            state.update_status(TrialStatus.ACCEPTED)
-            logger.info("Trial ACCEPTED - Generating verdict")
+            # 6. Check Decision
+            if decision.accepted:
+                display.show_agent_action("Judge", "Verdict reached!", is_loading=False)
+                state.update_status(TrialStatus.ACCEPTED)
+                logger.info("Trial ACCEPTED - Generating verdict")
 
-            display.show_verdict(topic, decision.verdict, decision)
-            save_verdict(topic, decision.verdict, state, decision)
-            return decision.verdict
-        else:
-            display.show_agent_action(
-                "Judge", "Verdict rejected. Requesting more evidence.", is_loading=False
-            )
-            state.update_status(TrialStatus.REJECTED)
-            state.set_feedback(
-                decision.feedback,
-                decision.suggested_queries_admirer,
-                decision.suggested_queries_critic
-            )
-            logger.info(f"Trial REJECTED - Feedback: {decision.feedback[:100]}...")
+                if research_task is not None:
+                    await _cancel_task(research_task)
+                    research_task = None
+
+                display.show_verdict(topic, decision.verdict, decision)
+                save_verdict(topic, decision.verdict, state, decision)
+                return decision.verdict
+            else:
+                display.show_agent_action(
+                    "Judge", "Verdict rejected. Requesting more evidence.", is_loading=False
+                )
+                state.update_status(TrialStatus.REJECTED)
+                state.set_feedback(
+                    decision.feedback,
+                    decision.suggested_queries_admirer,
+                    decision.suggested_queries_critic
+                )
+                logger.info(f"Trial REJECTED - Feedback: {decision.feedback[:100]}...")
+                reuse_research = state.can_continue()
+        finally:
+            if research_task is not None and not reuse_research:
+                await _cancel_task(research_task)
+                research_task = None
 
     # 7. Forced termination after MAX_ROUNDS
     state.update_status(TrialStatus.FORCED_TERMINATION)
@@ -374,13 +490,9 @@ async def run_trial(topic: str, *, model: object) -> str:
     )
     logger.warning("Max rounds reached - Forcing verdict generation")
 
-    # Generate a verdict from current evidence
-    # Deduplicate evidence while preserving order
-    unique_pos = list(dict.fromkeys(state.pos_data))
-    unique_neg = list(dict.fromkeys(state.neg_data))
-    
-    pos_text = "\n\n".join(unique_pos) if unique_pos else "No specific positive evidence gathered."
-    neg_text = "\n\n".join(unique_neg) if unique_neg else "No specific negative evidence gathered."
+    # Generate a verdict from current evidence (CourtState already dedupes on insert)
+    pos_text = "\n\n".join(state.pos_data) if state.pos_data else "No specific positive evidence gathered."
+    neg_text = "\n\n".join(state.neg_data) if state.neg_data else "No specific negative evidence gathered."
 
     forced_verdict = (
         f"FORCED VERDICT (Max Rounds Reached) for '{topic}'\n\n"
@@ -452,7 +564,6 @@ def main():
     )
 
     # Use a temporary console for startup errors
-    from rich.console import Console
     console = Console(stderr=True)
 
     if credentials_path:
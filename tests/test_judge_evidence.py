@@ -0,0 +1,19 @@
+from agents.judge import JudgeAgent
+
+
+def test_truncated_evidence_stays_within_max_chars():
+    evidence = ["a" * 2380, "bbbb " * 300]
+    out = JudgeAgent._format_evidence(evidence, max_chars=2400, max_item_chars=3000)
+    assert len(out) <= 2400
+
+
+def test_sentence_cut_counts_the_truncation_marker():
+    evidence = ["First sentence. " + "x" * 200]
+    for max_chars in range(20, 220, 7):
+        out = JudgeAgent._format_evidence(evidence, max_chars=max_chars, max_item_chars=3000)
+        assert len(out) <= max_chars
+
+
+def test_chunk_without_room_for_text_is_skipped():
+    out = JudgeAgent._format_evidence(["a" * 30, "b" * 100], max_chars=44, max_item_chars=3000)
+    assert out == "[1] " + "a" * 30
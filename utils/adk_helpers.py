@@ -1,9 +1,155 @@
 from __future__ import annotations
 
 import json
+import os
 from typing import Any, Iterable, Optional
 
 
+_RUNNERS: dict[tuple, Any] = {}
+
+try:  # orjson is optional; it parses tool payloads several times faster than json
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+def context_cache_config() -> Any:
+    """Return an ADK ContextCacheConfig when ADK_CONTEXT_CACHE=1, else None.
+
+    ADK creates Gemini CachedContent for the request prefix (system instruction,
+    tools, prior turns) from the second turn of a session once it reaches the
+    model's minimum size, so this only pays off with ADK_STATEFUL_SESSIONS=1.
+    """
+
+    enabled = (os.environ.get("ADK_CONTEXT_CACHE", "0") or "0").strip().lower() in {
+        "1",
+        "true",
+        "yes",
+        "y",
+    }
+    if not enabled:
+        return None
+    from google.adk.agents.context_cache_config import ContextCacheConfig
+
+    ttl = int(os.environ.get("ADK_CONTEXT_CACHE_TTL_SECONDS", "1800") or "1800")
+    return ContextCacheConfig(ttl_seconds=max(1, ttl))
+
+
+def stateful_sessions_enabled() -> bool:
+    """Whether agents keep one ADK session across calls (ADK_STATEFUL_SESSIONS=1)."""
+    return (os.environ.get("ADK_STATEFUL_SESSIONS", "0") or "0").strip().lower() in {
+        "1",
+        "true",
+        "yes",
+        "y",
+    }
+
+
+def shared_runner(agent: Any, app_name: str, *, cache_config: Any = None, pooled: bool = True) -> Any:
+    """Return a process-wide InMemoryRunner for an equivalently configured agent.
+
+    Runners are bound to their agent, so the pool key covers everything that shapes
+    the agent's requests. Callers should adopt runner.agent as their agent so that
+    both stay consistent when an existing runner is reused. A cache_config
+    (see context_cache_config) wraps the agent in an ADK App with context caching.
+    pooled=False builds a private runner instead; agents with stateful sessions need
+    one, since their fixed session ids would otherwise mix histories across agents.
+    """
+
+    if not pooled:
+        return _build_runner(agent, app_name, cache_config)
+
+    key = (
+        app_name,
+        agent.name,
+        repr(agent.model),
+        agent.instruction,
+        repr(agent.generate_content_config),
+        tuple(getattr(t, "__name__", repr(t)) for t in agent.tools or []),
+        repr(cache_config),
+    )
+    runner = _RUNNERS.get(key)
+    if runner is None:
+        runner = _build_runner(agent, app_name, cache_config)
+        _RUNNERS[key] = runner
+    return runner
+
+
+def _build_runner(agent: Any, app_name: str, cache_config: Any) -> Any:
+    from google.adk.runners import InMemoryRunner
+
+    if cache_config is None:
+        return InMemoryRunner(agent=agent, app_name=app_name)
+    from google.adk.apps import App
+
+    app = App(name=app_name, root_agent=agent, context_cache_config=cache_config)
+    return InMemoryRunner(app=app)
+
+
+try:  # google-api-core is optional here; other Google clients raise its typed 429s
+    from google.api_core.exceptions import ResourceExhausted, TooManyRequests
+
+    _RATE_LIMIT_TYPES: tuple[type[BaseException], ...] = (ResourceExhausted, TooManyRequests)
+except ImportError:
+    _RATE_LIMIT_TYPES = ()
+
+# Real rate-limit errors sit within a few wrapper layers; bounds the chain walk
+_MAX_CHAIN_DEPTH = 8
+
+# (class name, module prefix) of provider wrappers that always mean a 429
+_RATE_LIMIT_CLASSES = (("_ResourceExhaustedError", "google.adk"),)
+# Message markers for untyped errors; both cases are listed so no str.upper() is needed
+_RATE_LIMIT_MSG_TOKENS = ("RESOURCE_EXHAUSTED", "resource_exhausted", "429")
+
+
+def is_resource_exhausted(err: BaseException, message: str | None = None) -> bool:
+    """Detect Google ADK/GenAI rate limit (429) errors.
+
+    Walks the exception chain (at most _MAX_CHAIN_DEPTH links, cycle-safe) and checks,
+    in order:
+    - google.api_core ResourceExhausted/TooManyRequests, when installed
+    - the _RATE_LIMIT_CLASSES wrappers (ADK's _ResourceExhaustedError)
+    - google.genai.errors.APIError and subclasses via their structured code/status
+    - the error message for any of _RATE_LIMIT_MSG_TOKENS
+
+    Args:
+        err: The exception to inspect
+        message: Optional precomputed str(err), reused for the head of the chain
+    """
+    current: BaseException | None = err
+    seen: set[int] = set()
+    while current is not None and len(seen) < _MAX_CHAIN_DEPTH and id(current) not in seen:
+        seen.add(id(current))
+        if _RATE_LIMIT_TYPES and isinstance(current, _RATE_LIMIT_TYPES):
+            return True
+        cls = current.__class__
+        cls_name, module_name = cls.__name__, cls.__module__
+
+        if any(cls_name == name and module_name.startswith(prefix) for name, prefix in _RATE_LIMIT_CLASSES):
+            return True
+
+        # genai errors carry a structured code/status; decide without formatting
+        code = getattr(current, "code", None)
+        if isinstance(code, int) and module_name.startswith("google.genai"):
+            if code == 429 or getattr(current, "status", None) == "RESOURCE_EXHAUSTED":
+                return True
+        else:
+            if current is err and message is not None:
+                msg = message
+            else:
+                msg = getattr(current, "message", None)
+                if not isinstance(msg, str):
+                    msg = str(current)
+            if any(token in msg for token in _RATE_LIMIT_MSG_TOKENS):
+                return True
+
+        current = current.__cause__ or current.__context__
+
+    return False
+
+
 def _get_attr(obj: Any, name: str) -> Any:
     if obj is None:
         return None
@@ -13,24 +159,195 @@ def _get_attr(obj: Any, name: str) -> Any:
 
 
 def iter_parts(events: Iterable[Any]) -> Iterable[Any]:
-    for event in events or []:
-        content = _get_attr(event, "content") or _get_attr(event, "data")
-        parts = _get_attr(content, "parts")
-        if not parts:
+    # _get_attr inlined: this runs for every event of every scan
+    for event in events or ():
+        if isinstance(event, dict):
+            content = event.get("content") or event.get("data")
+        else:
+            content = getattr(event, "content", None) or getattr(event, "data", None)
+        if content is None:
             continue
-        for part in parts:
-            yield part
+        parts = content.get("parts") if isinstance(content, dict) else getattr(content, "parts", None)
+        if parts:
+            yield from parts
 
 
 def extract_text(events: Iterable[Any]) -> str:
     last_text = ""
     for part in iter_parts(events):
-        text = _get_attr(part, "text")
+        text = part.get("text") if isinstance(part, dict) else getattr(part, "text", None)
         if text:
             last_text = str(text)
     return (last_text or "").strip()
 
 
+async def run_first_text(runner: Any, prompt: str, *, user_id: str, session_id: str) -> str:
+    """Run a single-turn prompt and return the first non-empty text reply.
+
+    Streams events from runner.run_async and stops as soon as a text part arrives,
+    instead of buffering the whole invocation like run_debug. Only suitable for
+    tool-free prompts whose answer is a single text response. Runners without
+    run_async fall back to run_debug + extract_text.
+    """
+
+    if not hasattr(runner, "run_async") or not hasattr(runner, "session_service"):
+        events = await runner.run_debug(prompt, user_id=user_id, session_id=session_id, quiet=True)
+        return extract_text(events)
+
+    from contextlib import aclosing
+
+    from google.genai import types
+
+    session = await runner.session_service.get_session(
+        app_name=runner.app_name, user_id=user_id, session_id=session_id
+    )
+    if not session:
+        session = await runner.session_service.create_session(
+            app_name=runner.app_name, user_id=user_id, session_id=session_id
+        )
+
+    async with aclosing(
+        runner.run_async(
+            user_id=user_id,
+            session_id=session.id,
+            new_message=types.UserContent(parts=[types.Part(text=prompt)]),
+        )
+    ) as agen:
+        async for event in agen:
+            for part in iter_parts([event]):
+                text = _part_fields(part)[0]
+                if text and str(text).strip():
+                    return str(text).strip()
+    return ""
+
+
+async def run_until_tool_response(
+    runner: Any, prompt: str, *, user_id: str, session_id: str, tool_name: str
+) -> list[Any]:
+    """Run a prompt and collect its events, stopping once tool_name has executed.
+
+    The model's follow-up turn after a function response only restates the tool
+    output, so ending the stream at the matching function_response event saves a
+    full model round-trip. Invocations that never call the tool are collected to
+    completion, exactly like run_debug (which runners without run_async fall back to).
+    """
+
+    if not hasattr(runner, "run_async") or not hasattr(runner, "session_service"):
+        return await runner.run_debug(prompt, user_id=user_id, session_id=session_id, quiet=True)
+
+    from contextlib import aclosing
+
+    from google.genai import types
+
+    session = await runner.session_service.get_session(
+        app_name=runner.app_name, user_id=user_id, session_id=session_id
+    )
+    if not session:
+        session = await runner.session_service.create_session(
+            app_name=runner.app_name, user_id=user_id, session_id=session_id
+        )
+
+    events: list[Any] = []
+    async with aclosing(
+        runner.run_async(
+            user_id=user_id,
+            session_id=session.id,
+            new_message=types.UserContent(parts=[types.Part(text=prompt)]),
+        )
+    ) as agen:
+        async for event in agen:
+            events.append(event)
+            for part in iter_parts([event]):
+                fr = _part_fields(part)[1]
+                if fr and _get_attr(fr, "name") == tool_name:
+                    return events
+    return events
+
+
+async def discard_session(runner: Any, *, user_id: str, session_id: str) -> None:
+    """Delete a single-use session so the runner's session store does not grow per call.
+
+    Best-effort: runners without a session service and already-deleted sessions are ignored.
+    """
+
+    service = getattr(runner, "session_service", None)
+    if service is None:
+        return
+    try:
+        await service.delete_session(app_name=runner.app_name, user_id=user_id, session_id=session_id)
+    except Exception:
+        pass
+
+
+def _coerce_args(value: Any) -> dict[str, Any] | None:
+    if value is None:
+        return None
+    if isinstance(value, dict):
+        return value
+    if isinstance(value, str):
+        try:
+            parsed = _json_loads(value)
+            return parsed if isinstance(parsed, dict) else {"args": parsed}
+        except Exception:
+            return {"args": value}
+    return {"args": value}
+
+
+def _part_fields(part: Any) -> tuple[Any, Any, Any]:
+    """Return (text, function_response, function_call) of a part, resolving dict vs object once."""
+    if isinstance(part, dict):
+        return part.get("text"), part.get("function_response"), part.get("function_call")
+    return (
+        getattr(part, "text", None),
+        getattr(part, "function_response", None),
+        getattr(part, "function_call", None),
+    )
+
+
+def _tool_part_result(fr: Any, fc: Any, name: str) -> Optional[dict[str, Any]]:
+    """Return the parsed payload if fr/fc is a response from/call to tool name, else None."""
+
+    # Case 1: tool response (runner executed tool)
+    if fr:
+        if _get_attr(fr, "name") != name:
+            return None
+
+        response = _get_attr(fr, "response")
+        if response is None:
+            response = _get_attr(fr, "args")
+        args = _coerce_args(response) or {}
+        result = args.get("result") if isinstance(args, dict) else None
+
+        # ADK wraps non-dict tool returns under "result"; dict returns are
+        # passed through as the response itself
+        if result is None:
+            return args if isinstance(args, dict) else {}
+
+        if isinstance(result, dict):
+            return result
+
+        if isinstance(result, str):
+            try:
+                parsed = _json_loads(result)
+                if isinstance(parsed, dict):
+                    return parsed
+                return {"result": parsed}
+            except Exception:
+                return {"result": result}
+
+        return {"result": result}
+
+    # Case 2: tool call request (runner did not execute tool; still treat as a usable "result")
+    if fc:
+        if _get_attr(fc, "name") != name:
+            return None
+
+        args = _coerce_args(_get_attr(fc, "args"))
+        return args or {}
+
+    return None
+
+
 def extract_tool_result(events: Iterable[Any], tool_name: str) -> Optional[dict[str, Any]]:
     """Extract tool output for a named tool.
 
@@ -44,60 +361,24 @@ def extract_tool_result(events: Iterable[Any], tool_name: str) -> Optional[dict[
         - None if no matching tool part is found
     """
 
-    name = (tool_name or "").strip()
-    if not name:
-        return None
+    return scan_events(events, tool_name)[0]
 
-    def _coerce_args(value: Any) -> dict[str, Any] | None:
-        if value is None:
-            return None
-        if isinstance(value, dict):
-            return value
-        if isinstance(value, str):
-            try:
-                parsed = json.loads(value)
-                return parsed if isinstance(parsed, dict) else {"args": parsed}
-            except Exception:
-                return {"args": value}
-        return {"args": value}
 
-    for part in iter_parts(events):
-        # Case 1: tool response (runner executed tool)
-        fr = _get_attr(part, "function_response")
-        if fr:
-            fr_name = _get_attr(fr, "name")
-            if fr_name != name:
-                continue
-
-            args = _coerce_args(_get_attr(fr, "args")) or {}
-            result = args.get("result") if isinstance(args, dict) else None
-
-            # Most ADK tool responses place tool return under args.result
-            if result is None:
-                return {}
-
-            if isinstance(result, dict):
-                return result
-
-            if isinstance(result, str):
-                try:
-                    parsed = json.loads(result)
-                    if isinstance(parsed, dict):
-                        return parsed
-                    return {"result": parsed}
-                except Exception:
-                    return {"result": result}
-
-            return {"result": result}
-
-        # Case 2: tool call request (runner did not execute tool; still treat as a usable "result")
-        fc = _get_attr(part, "function_call")
-        if fc:
-            fc_name = _get_attr(fc, "name")
-            if fc_name != name:
-                continue
-
-            args = _coerce_args(_get_attr(fc, "args"))
-            return args or {}
+def scan_events(events: Iterable[Any], tool_name: str) -> tuple[Optional[dict[str, Any]], str]:
+    """Return (extract_tool_result, extract_text) results from a single pass over events.
 
-    return None
+    Stops at the first matching tool part; the text is then only what preceded it,
+    so callers that need the reply text should use it when the tool result is None.
+    """
+
+    name = (tool_name or "").strip()
+    last_text = ""
+    for part in iter_parts(events):
+        text, fr, fc = _part_fields(part)
+        if name and (fr or fc):
+            result = _tool_part_result(fr, fc, name)
+            if result is not None:
+                return result, last_text.strip()
+        if text:
+            last_text = str(text)
+    return None, last_text.strip()
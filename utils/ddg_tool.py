@@ -1,16 +1,96 @@
 """DuckDuckGo search tool for finding alternative sources."""
+import asyncio
 import logging
-from typing import Optional, List, Dict
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional, List, Dict
 
 logger = logging.getLogger(__name__)
 
-async def search_ddg(query: str, max_results: int = 5) -> List[Dict[str, str]]:
+_DEFAULT_MAX_ATTEMPTS = 3
+_DEFAULT_MAX_WORKERS = 2
+
+
+def _max_attempts() -> int:
+    try:
+        return int(os.environ.get("DUCKDUCKGO_MAX_ATTEMPTS", _DEFAULT_MAX_ATTEMPTS) or _DEFAULT_MAX_ATTEMPTS)
+    except ValueError:
+        return _DEFAULT_MAX_ATTEMPTS
+
+
+def _max_workers() -> int:
+    try:
+        return max(1, int(os.environ.get("DUCKDUCKGO_MAX_WORKERS", _DEFAULT_MAX_WORKERS) or _DEFAULT_MAX_WORKERS))
+    except ValueError:
+        return _DEFAULT_MAX_WORKERS
+
+
+# Dedicated, bounded pool for blocking DDGS calls: the default executor would let a
+# burst of searches hit DDG all at once, which is what trips its rate limit
+_executor = ThreadPoolExecutor(max_workers=_max_workers(), thread_name_prefix="ddgs")
+
+
+# One DDGS client per _executor thread: DDGS mutates its HTTP client's headers per
+# request, so instances are not shared across threads, but each thread keeps its
+# connection pool and cookies instead of a fresh session and TLS handshake per search
+_clients = threading.local()
+
+
+def _thread_client(ddgs_cls: Any) -> Any:
+    """Return this thread's DDGS instance, creating it on first use."""
+    client = getattr(_clients, "ddgs", None)
+    if client is None or not isinstance(client, ddgs_cls):
+        client = ddgs_cls()
+        _clients.ddgs = client
+    return client
+
+
+def _search_ddg_sync(ddgs_cls: Any, query: str, max_results: int) -> List[Dict[str, str]]:
+    """Run the blocking DDGS search and collect usable results (called off the event loop)."""
+    results = []
+    ddgs = _thread_client(ddgs_cls)
+    try:
+        # ddgs.text returns an iterator/generator
+        ddg_gen = ddgs.text(query, max_results=max_results)
+    except Exception:
+        # Start the next attempt from a fresh session (new cookies and fingerprint)
+        _clients.ddgs = None
+        raise
+    if ddg_gen:
+        for r in ddg_gen:
+            title = r.get('title', '')
+            snippet = r.get('body', '')
+            url = r.get('href', '')
+            
+            # Basic validation: ensure we have meaningful content
+            if not title or not snippet:
+                continue
+                
+            # Filter out results with suspicious dates (e.g., future dates or obviously wrong parsing)
+            # This is a heuristic; deeper date parsing would be better but expensive
+            # For now, we trust the search engine mostly but could filter if snippet starts with future year
+            
+            # Trusted domain boost (optional but good for quality)
+            # We don't discard others, just a note that we accept them
+            
+            results.append({
+                'title': title,
+                'snippet': snippet,
+                'url': url,
+            })
+    return results
+
+
+async def search_ddg(query: str, max_results: int = 5, *, max_attempts: int | None = None) -> List[Dict[str, str]]:
     """
     Search DuckDuckGo for relevant results.
     
     Args:
         query: Search query string
         max_results: Maximum number of results to return
+        max_attempts: Tries on DDG rate limiting, with 1s, 2s, ... backoff
+            (default DUCKDUCKGO_MAX_ATTEMPTS, 3)
         
     Returns:
         List of dicts with 'title', 'snippet', 'url' keys
@@ -20,39 +100,33 @@ async def search_ddg(query: str, max_results: int = 5) -> List[Dict[str, str]]:
         # Try importing from ddgs first (new package name)
         try:
             from ddgs import DDGS
+            from ddgs.exceptions import RatelimitException
         except ImportError:
             # Fallback to old package name
             from duckduckgo_search import DDGS
-        
-        results = []
-        # DDGS is synchronous but fast enough for this use case, or we could run in executor if needed.
-        # Ideally we should run this in a thread if it blocks, but for now we follow the simple implementation.
-        with DDGS() as ddgs:
-            # ddgs.text returns an iterator/generator
-            ddg_gen = ddgs.text(query, max_results=max_results)
-            if ddg_gen:
-                for r in ddg_gen:
-                    title = r.get('title', '')
-                    snippet = r.get('body', '')
-                    url = r.get('href', '')
-                    
-                    # Basic validation: ensure we have meaningful content
-                    if not title or not snippet:
-                        continue
-                        
-                    # Filter out results with suspicious dates (e.g., future dates or obviously wrong parsing)
-                    # This is a heuristic; deeper date parsing would be better but expensive
-                    # For now, we trust the search engine mostly but could filter if snippet starts with future year
-                    
-                    # Trusted domain boost (optional but good for quality)
-                    # We don't discard others, just a note that we accept them
-                    
-                    results.append({
-                        'title': title,
-                        'snippet': snippet,
-                        'url': url,
-                    })
-        return results
+            from duckduckgo_search.exceptions import RatelimitException
+
+        if max_attempts is None:
+            max_attempts = _max_attempts()
+        max_attempts = max(1, max_attempts)
+
+        for attempt in range(max_attempts):
+            try:
+                # DDGS is synchronous (HTTP round-trip plus result iteration); run it in a
+                # worker thread so concurrent Admirer/Critic searches overlap
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(_executor, _search_ddg_sync, DDGS, query, max_results)
+            except RatelimitException as e:
+                # DDG throttles bursts (roughly 5 requests per 10s); transient, so back off
+                if attempt >= max_attempts - 1:
+                    raise
+                delay = 2 ** attempt
+                logger.warning(
+                    "DDG rate limited, retrying after backoff",
+                    extra={"attempt": attempt + 1, "max_attempts": max_attempts, "delay_seconds": delay, "error": str(e)},
+                )
+                await asyncio.sleep(delay)
+        return []
     except ImportError:
         logger.warning("ddgs/duckduckgo-search not installed, DDG search unavailable")
         return []
@@ -1,13 +1,28 @@
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
-from rich.layout import Layout
-from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.theme import Theme
-from rich.style import Style
 from typing import Optional, List, Any
+from contextlib import nullcontext
+import json
 import time
 
+try:  # orjson is optional and only speeds up summary formatting
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps_indented(data: dict) -> str:
+    """Pretty-print a summary dict, preferring orjson when installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            # orjson rejects non-str keys and unknown types that json would accept
+            pass
+    return json.dumps(data, indent=2)
+
 # Custom theme for the court
 court_theme = Theme({
     "admirer": "green",
@@ -20,6 +35,16 @@ court_theme = Theme({
     "step": "bold white on blue",
 })
 
+# Agent name -> (theme style, icon) for show_agent_action
+_AGENT_STYLES = {
+    "Admirer": ("admirer", "📢"),
+    "Critic": ("critic", "🔍"),
+    "Judge": ("judge", "⚖️"),
+}
+_DEFAULT_AGENT_STYLE = ("neutral", "🤖")
+# Evidence panels show at most this many characters of the findings
+_MAX_EVIDENCE_DISPLAY_CHARS = 500
+
 class TrialDisplay:
     """
     Handles rich console output for the Historical Court.
@@ -44,8 +69,9 @@ class TrialDisplay:
             border_style="judge",
             padding=(1, 2)
         )
-        self.console.print(grid)
-        self.console.print()
+        with self.batch():
+            self.console.print(grid)
+            self.console.print()
 
     def show_round_start(self, round_num: int, max_rounds: int):
         """Display the start of a new round."""
@@ -67,16 +93,10 @@ class TrialDisplay:
         if not self.show_steps:
             return
             
-        style = agent_name.lower()
-        if style not in ["admirer", "critic", "judge"]:
-            style = "neutral"
-            
-        icon = {
-            "Admirer": "📢",
-            "Critic": "🔍",
-            "Judge": "⚖️"
-        }.get(agent_name, "🤖")
-        
+        style, icon = _AGENT_STYLES.get(agent_name, _DEFAULT_AGENT_STYLE)
+        if style == "neutral" and agent_name.lower() in ("admirer", "critic", "judge"):
+            style = agent_name.lower()
+
         self.console.print(f"[{style}]{icon} {agent_name}:[/] {action}")
 
     def show_evidence(self, agent_name: str, query: str, findings: str):
@@ -88,9 +108,10 @@ class TrialDisplay:
         border_style = style
         
         # Truncate findings for display if too long
-        display_findings = findings
-        if len(display_findings) > 500:
-            display_findings = display_findings[:497] + "..."
+        if len(findings) > _MAX_EVIDENCE_DISPLAY_CHARS:
+            display_findings = f"{findings[:_MAX_EVIDENCE_DISPLAY_CHARS - 3]}..."
+        else:
+            display_findings = findings
 
         content = Text.assemble(
             (f"Query: {query}\n\n", "bold"),
@@ -98,7 +119,8 @@ class TrialDisplay:
         )
         
         # If no evidence found, use a different style
-        if "no" in display_findings.lower() and "evidence" in display_findings.lower():
+        lowered = display_findings.lower()
+        if "no" in lowered and "evidence" in lowered:
             border_style = "dim white"
             
         panel = Panel(
@@ -130,17 +152,12 @@ class TrialDisplay:
             verdict: The text verdict
             decision: The JudgeDecision object (typed as Any to avoid import cycles)
         """
-        self.console.print()
-        self.console.rule("[bold red]FINAL VERDICT[/bold red]")
-        self.console.print()
-        
         # Extract confidence and summary if available
         confidence = getattr(decision, 'confidence', 'N/A')
         summary_data = getattr(decision, 'summary', None)
         
         if isinstance(summary_data, dict):
-            import json
-            summary_str = json.dumps(summary_data, indent=2)
+            summary_str = _dumps_indented(summary_data)
         else:
             summary_str = str(summary_data) if summary_data else "No summary provided."
 
@@ -152,27 +169,35 @@ class TrialDisplay:
             ("Key Factors:\n", "bold cyan"), (summary_str, "white")
         )
         
-        self.console.print(Panel(
-            verdict_text,
-            title=f"Verdict: {topic}",
-            border_style="judge",
-            padding=(1, 2)
-        ))
-        
-        self.console.print(Panel(
-            details_text,
-            title="Judge's Rationale",
-            border_style="blue",
-            padding=(1, 2)
-        ))
+        with self.batch():
+            self.console.print()
+            self.console.rule("[bold red]FINAL VERDICT[/bold red]")
+            self.console.print()
+            self.console.print(Panel(
+                verdict_text,
+                title=f"Verdict: {topic}",
+                border_style="judge",
+                padding=(1, 2)
+            ))
+            self.console.print(Panel(
+                details_text,
+                title="Judge's Rationale",
+                border_style="blue",
+                padding=(1, 2)
+            ))
         
+    def batch(self):
+        """Context manager that renders everything printed inside it in one write.
+
+        Rich's Console buffers output while used as a context manager and flushes
+        it on exit, so a group of panels costs one terminal write instead of one each.
+        """
+        return self.console
+
     def progress_spinner(self, description: str):
         """Context manager for a loading spinner."""
         if not self.show_steps:
-            # Return a dummy context manager if steps are hidden
-            class Dummy:
-                def __enter__(self): return self
-                def __exit__(self, *args): pass
-            return Dummy()
+            # No-op context manager if steps are hidden
+            return nullcontext()
             
         return self.console.status(description, spinner="dots")
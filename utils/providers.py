@@ -1,8 +1,11 @@
+from __future__ import annotations
+
 import os
-from typing import Protocol, runtime_checkable
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
-from google.adk import Agent
-from google.adk.runners import InMemoryRunner
+if TYPE_CHECKING:  # ADK is imported on first use so importing this module stays cheap
+    from google.adk import Agent
+    from google.adk.runners import InMemoryRunner
 
 @runtime_checkable
 class BaseProvider(Protocol):
@@ -42,6 +45,8 @@ class AdkProvider:
         description: str | None = None,
         tools: list | None = None,
     ) -> Agent:
+        from google.adk import Agent
+
         return Agent(
             name=name,
             model=self.model_name,
@@ -51,4 +56,6 @@ class AdkProvider:
         )
 
     def create_runner(self, agent: Agent) -> InMemoryRunner:
+        from google.adk.runners import InMemoryRunner
+
         return InMemoryRunner(agent=agent, app_name=self.app_name)
@@ -1,16 +1,48 @@
 """Combined search utility with fallback capabilities."""
+import asyncio
 import logging
+import os
 import re
-from typing import Dict, Optional, Any, List
+import time
+from typing import Dict, Optional, Any, List, Tuple
 
 from utils.wiki_tool import search_and_summarize
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_RESULT_TTL_SECONDS = 900
+_MAX_CACHED_RESULTS = 256
+
+# Combined Wikipedia/DDG results per normalized (query, topic, focus term, fallback);
+# Wikipedia alone is cached on disk, this also spares repeat DDG round-trips
+_results: Dict[tuple, Tuple[float, Dict[str, Any]]] = {}
+_inflight: Dict[tuple, asyncio.Future] = {}
+
+
+def _speculative_ddg_enabled() -> bool:
+    return (os.getenv("SEARCH_SPECULATIVE_DDG", "0") or "0").strip().lower() in {"1", "true", "yes", "y"}
+
+
+def _result_ttl_seconds() -> int:
+    raw = (os.getenv("SEARCH_RESULT_TTL_SECONDS") or "").strip()
+    try:
+        return max(0, int(raw)) if raw else _DEFAULT_RESULT_TTL_SECONDS
+    except ValueError:
+        return _DEFAULT_RESULT_TTL_SECONDS
+
+_WORD_RE = re.compile(r"[A-Za-z0-9]+")
+# Listing pages (blog tags/categories, author archives, Blogger labels) rank well
+# for names but carry no substantive content
+_URL_DENY_RE = re.compile(r"/(?:tag|category|author|label)/")
+# search_and_summarize's failure messages, which it always returns as the whole text
+_WIKI_FAILURE_RE = re.compile(r"(?:no wikipedia|wikipedia error|no good wikipedia search result)", re.IGNORECASE)
+
+
 def _tokenize_relevance(text: str) -> List[str]:
+    """Distinct lowercase words longer than 3 characters, in order of appearance."""
     if not text:
         return []
-    return [t.lower() for t in re.findall(r"[A-Za-z0-9]+", text) if len(t) > 3]
+    return list(dict.fromkeys(t.lower() for t in _WORD_RE.findall(text) if len(t) > 3))
 
 
 async def search_with_fallback(
@@ -18,12 +50,71 @@ async def search_with_fallback(
     topic: str,
     use_ddg_fallback: bool = True,
     focus_term: Optional[str] = None,
+    *,
+    speculative_ddg: bool | None = None,
 ) -> Dict[str, Any]:
     """
     Search Wikipedia first, fall back to DuckDuckGo if no results.
     
-    Returns combined results with source attribution.
+    Returns combined results with source attribution. Results are kept in memory
+    for SEARCH_RESULT_TTL_SECONDS (default 900, 0 disables), and concurrent identical
+    searches share one lookup.
+
+    With speculative_ddg (default SEARCH_SPECULATIVE_DDG, off) the DuckDuckGo search
+    starts alongside Wikipedia and is cancelled if Wikipedia succeeds, so a Wikipedia
+    miss no longer costs a second sequential round-trip. It spends a DDG request on
+    every cold search, which makes DDG rate limiting more likely.
     """
+    if speculative_ddg is None:
+        speculative_ddg = _speculative_ddg_enabled()
+    ttl = _result_ttl_seconds()
+    if ttl <= 0:
+        return await _search_with_fallback(query, topic, use_ddg_fallback, focus_term, speculative_ddg)
+
+    key = (
+        (query or "").strip().lower(),
+        (topic or "").strip().lower(),
+        (focus_term or "").strip().lower(),
+        use_ddg_fallback,
+    )
+    hit = _results.get(key)
+    if hit is not None:
+        if time.monotonic() - hit[0] < ttl:
+            logger.debug("Search result cache hit", extra={"query": query})
+            return dict(hit[1])
+        del _results[key]
+
+    # Single-flight: concurrent callers with the same key share one search
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(
+            _search_with_fallback(query, topic, use_ddg_fallback, focus_term, speculative_ddg)
+        )
+        _inflight[key] = task
+
+        def _done(t: asyncio.Future) -> None:
+            _inflight.pop(key, None)
+            # search_ddg and search_and_summarize report outages as empty/error results
+            # rather than raising, so a 'none' result may be transient: never replay it
+            if t.cancelled() or t.exception() is not None or t.result().get('source') == 'none':
+                return
+            if len(_results) >= _MAX_CACHED_RESULTS:
+                _results.pop(next(iter(_results)), None)  # oldest insertion first
+            _results[key] = (time.monotonic(), t.result())
+
+        task.add_done_callback(_done)
+
+    # Shield so one caller's cancellation does not cancel the search for the others
+    return dict(await asyncio.shield(task))
+
+
+async def _search_with_fallback(
+    query: str,
+    topic: str,
+    use_ddg_fallback: bool,
+    focus_term: Optional[str],
+    speculative_ddg: bool = False,
+) -> Dict[str, Any]:
     # Try Wikipedia first
     # search_and_summarize returns a string (summary) or error message.
     # We need to parse or handle the string return from search_and_summarize.
@@ -50,17 +141,27 @@ async def search_with_fallback(
     # If I follow the user's snippet exactly, it will break because search_and_summarize returns str.
     # I will adapt the logic to handle the string return from wiki_tool.
     
-    wiki_text = await search_and_summarize(query, focus_term=focus_term)
+    from utils.ddg_tool import search_ddg
+    # Construct a search query that includes the topic
+    ddg_query = f"{topic} {query}" if topic not in query else query
+    ddg_task = None
+    if use_ddg_fallback and speculative_ddg:
+        ddg_task = asyncio.ensure_future(search_ddg(ddg_query))
+
+    try:
+        wiki_text = await search_and_summarize(query, focus_term=focus_term)
+    except BaseException:
+        if ddg_task is not None:
+            ddg_task.cancel()
+        raise
     
-    # Check if wiki_text indicates failure
-    is_wiki_failure = (
-        not wiki_text 
-        or wiki_text.lower().startswith("no wikipedia") 
-        or wiki_text.lower().startswith("wikipedia error")
-        or "no good wikipedia search result" in wiki_text.lower()
-    )
+    # Check if wiki_text indicates failure; match() only inspects the prefix, so
+    # successful multi-KB summaries are never lowercased
+    is_wiki_failure = not wiki_text or _WIKI_FAILURE_RE.match(wiki_text) is not None
     
     if not is_wiki_failure:
+        if ddg_task is not None:
+            ddg_task.cancel()
         return {
             'title': f"Wikipedia results for {query}", # Placeholder title as we get combined summaries
             'summary': wiki_text,
@@ -71,46 +172,39 @@ async def search_with_fallback(
     # Fallback to DuckDuckGo
     if use_ddg_fallback:
         logger.info(f"Wikipedia search failed for '{query}', falling back to DuckDuckGo")
-        from utils.ddg_tool import search_ddg
-        # Construct a search query that includes the topic
-        ddg_query = f"{topic} {query}" if topic not in query else query
-        ddg_results = await search_ddg(ddg_query)
+        ddg_results = await (ddg_task if ddg_task is not None else search_ddg(ddg_query))
         
         if ddg_results:
             # Filter DDG results for relevance
-            relevant_results = []
             relevance_seed = focus_term if focus_term is not None else (query or topic)
             relevance_words = _tokenize_relevance(relevance_seed)
             if not relevance_words:
                 relevance_words = _tokenize_relevance(topic)
+            # Require at least 2 matching tokens for stricter relevance, or 1 if we only have 1 token
+            min_matches = 2 if len(relevance_words) > 1 else 1
 
             for res in ddg_results:
                 # Filter out obvious low-quality pages like tags/categories
-                if "/tag/" in res['url'] or "/category/" in res['url']:
+                if _URL_DENY_RE.search(res['url']):
                     continue
 
                 # Basic check: Topic keywords must appear in title or snippet
                 text_to_check = (res['title'] + " " + res['snippet']).lower()
                 # At least one significant relevance word should be present
-                # Require at least 2 matching tokens for stricter relevance, or 1 if we only have 1 token
-                min_matches = 2 if len(relevance_words) > 1 else 1
                 
                 # Boost strictness: if we have multiple words, require them to appear in the SNIPPET too?
                 # Or just rely on the token count. The "BlogOKC" result had "Steve Jobs" in title.
                 # Adding the URL filter above should catch the specific reported issue.
                 
                 if sum(1 for w in relevance_words if w in text_to_check) >= min_matches:
-                    relevant_results.append(res)
-            
-            if relevant_results:
-                # Return the most relevant DDG result
-                best = relevant_results[0]
-                return {
-                    'title': best['title'],
-                    'summary': best['snippet'],
-                    'url': best['url'],
-                    'source': 'duckduckgo'
-                }
+                    # Results are in DDG rank order, so the first relevant one is the best;
+                    # the rest need not be checked
+                    return {
+                        'title': res['title'],
+                        'summary': res['snippet'],
+                        'url': res['url'],
+                        'source': 'duckduckgo'
+                    }
             
     return {
         'title': 'No results',
@@ -0,0 +1,123 @@
+"""Embedding-based cache for near-duplicate search query generation.
+
+Topics like "Napoleon" vs "Napoleon Bonaparte", or lightly paraphrased Judge
+feedback, tend to produce the same search query. This cache embeds the prompt
+inputs with a small local sentence-transformers model and returns a previously
+generated query when cosine similarity exceeds a threshold.
+
+The cache is opt-in (SEMANTIC_QUERY_CACHE=1) and degrades to a no-op when
+sentence-transformers/numpy are not installed.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from typing import Any, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+_DEFAULT_THRESHOLD = 0.92
+_DEFAULT_MAX_ENTRIES = 256
+
+_encoder: Any = None
+_encoder_failed = False
+
+
+def semantic_cache_enabled() -> bool:
+    return (os.environ.get("SEMANTIC_QUERY_CACHE", "0") or "0").strip().lower() in {
+        "1",
+        "true",
+        "yes",
+        "y",
+    }
+
+
+def _get_encoder() -> Any:
+    """Load the embedding model once per process; None if unavailable."""
+    global _encoder, _encoder_failed
+    if _encoder is not None or _encoder_failed:
+        return _encoder
+    try:
+        from sentence_transformers import SentenceTransformer
+
+        model_name = (os.environ.get("SEMANTIC_QUERY_CACHE_MODEL") or "").strip() or _DEFAULT_MODEL
+        _encoder = SentenceTransformer(model_name)
+    except ImportError:
+        logger.warning("sentence-transformers not installed, semantic query cache unavailable")
+        _encoder_failed = True
+    except Exception as e:
+        logger.error(f"Failed to load semantic cache model: {e}")
+        _encoder_failed = True
+    return _encoder
+
+
+class SemanticQueryCache:
+    """Nearest-neighbour cache mapping embedded prompt inputs to generated queries.
+
+    Lookups and stores run on worker threads (asyncio.to_thread), so the entries live
+    in one immutable (vecs, queries) snapshot: readers take it in a single attribute
+    read and writers swap in a new one under a lock.
+
+    Attributes:
+        role: Agent role prefixed to every embedded string so polarities never mix
+        threshold: Minimum cosine similarity for a hit
+    """
+
+    def __init__(
+        self,
+        role: str,
+        *,
+        threshold: float | None = None,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+    ):
+        self.role = role
+        if threshold is None:
+            try:
+                threshold = float(os.environ.get("SEMANTIC_QUERY_CACHE_THRESHOLD", _DEFAULT_THRESHOLD))
+            except ValueError:
+                threshold = _DEFAULT_THRESHOLD
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._entries: Tuple[Any, Tuple[str, ...]] = (None, ())
+        self._lock = threading.Lock()
+
+    def _embed(self, text: str) -> Any:
+        encoder = _get_encoder()
+        if encoder is None:
+            return None
+        # normalize_embeddings=True makes the dot product a cosine similarity
+        return encoder.encode(f"{self.role}: {text}", normalize_embeddings=True)
+
+    def lookup(self, text: str) -> Tuple[Optional[str], Any]:
+        """Return the cached query for the most similar input (or None) and the input's embedding.
+
+        Pass the embedding to store() after a miss so the input is not encoded twice.
+        """
+        v = self._embed(text)
+        vecs, queries = self._entries
+        if v is None or not queries:
+            return None, v
+        sims = vecs @ v
+        best = int(sims.argmax())
+        if float(sims[best]) > self.threshold:
+            return queries[best], v
+        return None, v
+
+    def store(self, text: str, query: str, vec: Any = None) -> None:
+        """Record a generated query for the given input text (or its embedding from lookup())."""
+        v = self._embed(text) if vec is None else vec
+        if v is None:
+            return
+        import numpy as np
+
+        row = v.reshape(1, -1)
+        with self._lock:
+            vecs, queries = self._entries
+            vecs = row if vecs is None else np.vstack([vecs, row])
+            queries = queries + (query,)
+            if len(queries) > self.max_entries:
+                vecs, queries = vecs[1:], queries[1:]
+            self._entries = (vecs, queries)
@@ -3,8 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from threading import RLock
-from typing import Dict, List
+from threading import Lock
+from typing import Dict, List, Set
 
 
 class TrialStatus(Enum):
@@ -21,7 +21,41 @@ class TrialStatus(Enum):
     COMPLETED = "completed"
 
 
-@dataclass
+# Valid status transitions, built once instead of on every update_status call
+_TRANSITIONS: Dict[TrialStatus, frozenset[TrialStatus]] = {
+    TrialStatus.IDLE: frozenset({TrialStatus.INITIALIZED}),
+    TrialStatus.INITIALIZED: frozenset({TrialStatus.RESEARCHING}),
+    TrialStatus.RESEARCHING: frozenset({TrialStatus.DELIBERATING, TrialStatus.RESEARCHING}),
+    TrialStatus.DELIBERATING: frozenset({TrialStatus.ACCEPTED, TrialStatus.REJECTED, TrialStatus.FORCED_TERMINATION}),
+    TrialStatus.REJECTED: frozenset({TrialStatus.RESEARCHING, TrialStatus.FORCED_TERMINATION}),
+    TrialStatus.ACCEPTED: frozenset({TrialStatus.GENERATING_VERDICT}),
+    TrialStatus.FORCED_TERMINATION: frozenset({TrialStatus.GENERATING_VERDICT}),
+    TrialStatus.GENERATING_VERDICT: frozenset({TrialStatus.COMPLETED}),
+    TrialStatus.COMPLETED: frozenset(),
+}
+
+def _identity(value: List[str]) -> List[str]:
+    return value
+
+
+# Statuses in which reaching max_rounds ends the trial loop
+_ROUND_LIMITED_STATUSES = frozenset({TrialStatus.REJECTED, TrialStatus.RESEARCHING, TrialStatus.DELIBERATING})
+
+# (field, container type) of CourtState fields that hold strings, validated on construction
+_STR_CONTAINER_FIELDS = (
+    ("pos_data", list),
+    ("neg_data", list),
+    ("used_queries_admirer", list),
+    ("used_queries_critic", list),
+    ("evidence_hashes", set),
+    ("seen_titles_admirer", set),
+    ("seen_titles_critic", set),
+    ("suggested_queries_admirer", list),
+    ("suggested_queries_critic", list),
+)
+
+
+@dataclass(slots=True)
 class CourtState:
     """Central state management for The Historical Court trial process.
 
@@ -49,7 +83,11 @@ class CourtState:
     status: TrialStatus = TrialStatus.IDLE
     created_at: datetime = field(default_factory=datetime.now)
 
-    _lock: RLock = field(default_factory=RLock, init=False, repr=False, compare=False)
+    # Plain Lock: no locked method calls another while holding it
+    _lock: Lock = field(default_factory=Lock, init=False, repr=False, compare=False)
+    # Membership sets for dedup-on-insert, so pos_data/neg_data never hold repeats
+    _pos_seen: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+    _neg_seen: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate initial state values."""
@@ -65,41 +103,22 @@ class CourtState:
         if self.rounds > self.max_rounds:
             raise ValueError("rounds cannot be greater than max_rounds")
 
-        if not isinstance(self.pos_data, list) or not all(isinstance(x, str) for x in self.pos_data):
-            raise ValueError("pos_data must be a list[str]")
-
-        if not isinstance(self.neg_data, list) or not all(isinstance(x, str) for x in self.neg_data):
-            raise ValueError("neg_data must be a list[str]")
-
-        if not isinstance(self.used_queries_admirer, list) or not all(isinstance(x, str) for x in self.used_queries_admirer):
-            raise ValueError("used_queries_admirer must be a list[str]")
-
-        if not isinstance(self.used_queries_critic, list) or not all(isinstance(x, str) for x in self.used_queries_critic):
-            raise ValueError("used_queries_critic must be a list[str]")
-
-        if not isinstance(self.evidence_hashes, set) or not all(isinstance(x, str) for x in self.evidence_hashes):
-            raise ValueError("evidence_hashes must be a set[str]")
-
-        if not isinstance(self.seen_titles_admirer, set) or not all(isinstance(x, str) for x in self.seen_titles_admirer):
-            raise ValueError("seen_titles_admirer must be a set[str]")
-
-        if not isinstance(self.seen_titles_critic, set) or not all(isinstance(x, str) for x in self.seen_titles_critic):
-            raise ValueError("seen_titles_critic must be a set[str]")
+        for name, container in _STR_CONTAINER_FIELDS:
+            value = getattr(self, name)
+            # The per-item sweep is O(items), so like assertions it is skipped under python -O
+            if not isinstance(value, container) or (__debug__ and not all(isinstance(x, str) for x in value)):
+                raise ValueError(f"{name} must be a {container.__name__}[str]")
+        self._pos_seen.update(self.pos_data)
+        self._neg_seen.update(self.neg_data)
 
         if not isinstance(self.feedback, str):
             raise ValueError("feedback must be a string")
 
-        if not isinstance(self.suggested_queries_admirer, list) or not all(isinstance(x, str) for x in self.suggested_queries_admirer):
-            raise ValueError("suggested_queries_admirer must be a list[str]")
-
-        if not isinstance(self.suggested_queries_critic, list) or not all(isinstance(x, str) for x in self.suggested_queries_critic):
-            raise ValueError("suggested_queries_critic must be a list[str]")
-
         if not isinstance(self.status, TrialStatus):
             raise ValueError("status must be a TrialStatus")
 
     def add_positive_evidence(self, evidence: str, title: str = "") -> None:
-        """Add a single piece of evidence from the Admirer.
+        """Add a single piece of evidence from the Admirer; repeats of recorded evidence are ignored.
 
         Args:
             evidence: A non-empty evidence string.
@@ -115,12 +134,14 @@ class CourtState:
 
         with self._lock:
             self._ensure_mutable()
-            self.pos_data.append(evidence)
+            if evidence not in self._pos_seen:
+                self._pos_seen.add(evidence)
+                self.pos_data.append(evidence)
             if title:
                 self.seen_titles_admirer.add(title)
 
     def add_negative_evidence(self, evidence: str, title: str = "") -> None:
-        """Add a single piece of evidence from the Critic.
+        """Add a single piece of evidence from the Critic; repeats of recorded evidence are ignored.
 
         Args:
             evidence: A non-empty evidence string.
@@ -136,7 +157,9 @@ class CourtState:
 
         with self._lock:
             self._ensure_mutable()
-            self.neg_data.append(evidence)
+            if evidence not in self._neg_seen:
+                self._neg_seen.add(evidence)
+                self.neg_data.append(evidence)
             if title:
                 self.seen_titles_critic.add(title)
 
@@ -201,22 +224,24 @@ class CourtState:
 
     def is_complete(self) -> bool:
         """Return True if the trial has reached a completed terminal state."""
-        with self._lock:
-            return self.status == TrialStatus.COMPLETED
+        # A single attribute read is atomic; no lock needed
+        return self.status == TrialStatus.COMPLETED
 
     def can_continue(self) -> bool:
         """Return True if the trial loop can continue safely.
 
         The trial can continue if it is not completed and the round limit has not been exceeded.
+        Runs without the lock: status is read once and rounds only grows, so a concurrent
+        update can at worst make this answer stale by one call, never invalid.
         """
-        with self._lock:
-            if self.status == TrialStatus.COMPLETED:
-                return False
+        status = self.status
+        if status == TrialStatus.COMPLETED:
+            return False
 
-            if self.rounds >= self.max_rounds and self.status in {TrialStatus.REJECTED, TrialStatus.RESEARCHING, TrialStatus.DELIBERATING}:
-                return False
+        if self.rounds >= self.max_rounds and status in _ROUND_LIMITED_STATUSES:
+            return False
 
-            return True
+        return True
 
     def get_evidence_summary(self) -> Dict[str, object]:
         """Get a structured summary of evidence and key state fields.
@@ -238,15 +263,22 @@ class CourtState:
                 "created_at": self.created_at.isoformat(),
             }
 
-    def to_dict(self) -> Dict[str, object]:
-        """Serialize the state to a JSON-friendly dictionary."""
+    def to_dict(self, *, copy_lists: bool = True) -> Dict[str, object]:
+        """Serialize the state to a JSON-friendly dictionary.
+
+        Args:
+            copy_lists: Copy the evidence/query lists. Pass False when the result is
+                serialized straight away (e.g. json.dumps); the dict then shares the
+                live lists, which must not be mutated and keep changing with the state.
+        """
+        copy = list if copy_lists else _identity
         with self._lock:
             return {
                 "topic": self.topic,
-                "pos_data": list(self.pos_data),
-                "neg_data": list(self.neg_data),
-                "used_queries_admirer": list(self.used_queries_admirer),
-                "used_queries_critic": list(self.used_queries_critic),
+                "pos_data": copy(self.pos_data),
+                "neg_data": copy(self.neg_data),
+                "used_queries_admirer": copy(self.used_queries_admirer),
+                "used_queries_critic": copy(self.used_queries_critic),
                 "rounds": self.rounds,
                 "max_rounds": self.max_rounds,
                 "feedback": self.feedback,
@@ -268,16 +300,6 @@ class CourtState:
             raise RuntimeError(f"cannot mutate state when status={self.status.value}")
 
     @staticmethod
-    def _allowed_next_statuses(current: TrialStatus) -> set[TrialStatus]:
+    def _allowed_next_statuses(current: TrialStatus) -> frozenset[TrialStatus]:
         """Return the allowed next statuses given a current status."""
-        return {
-            TrialStatus.IDLE: {TrialStatus.INITIALIZED},
-            TrialStatus.INITIALIZED: {TrialStatus.RESEARCHING},
-            TrialStatus.RESEARCHING: {TrialStatus.DELIBERATING, TrialStatus.RESEARCHING},
-            TrialStatus.DELIBERATING: {TrialStatus.ACCEPTED, TrialStatus.REJECTED, TrialStatus.FORCED_TERMINATION},
-            TrialStatus.REJECTED: {TrialStatus.RESEARCHING, TrialStatus.FORCED_TERMINATION},
-            TrialStatus.ACCEPTED: {TrialStatus.GENERATING_VERDICT},
-            TrialStatus.FORCED_TERMINATION: {TrialStatus.GENERATING_VERDICT},
-            TrialStatus.GENERATING_VERDICT: {TrialStatus.COMPLETED},
-            TrialStatus.COMPLETED: set(),
-        }.get(current, set())
+        return _TRANSITIONS.get(current, frozenset())
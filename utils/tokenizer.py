@@ -0,0 +1,53 @@
+"""Optional local token counting for prompt budgets.
+
+Uses google-genai's LocalTokenizer (requires sentencepiece; the tokenizer model
+is downloaded and cached on first use). When it is unavailable, count_tokens
+returns None and callers should fall back to character budgets.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Gemini 2.x models share one tokenizer, so a single instance serves the app
+_DEFAULT_TOKENIZER_MODEL = "gemini-2.5-flash"
+
+_tokenizer: Any = None
+_tokenizer_failed = False
+
+
+def _get_tokenizer() -> Any:
+    """Load the local tokenizer once per process; None if unavailable."""
+    global _tokenizer, _tokenizer_failed
+    if _tokenizer is not None or _tokenizer_failed:
+        return _tokenizer
+    try:
+        from google.genai.local_tokenizer import LocalTokenizer
+
+        _tokenizer = LocalTokenizer(model_name=_DEFAULT_TOKENIZER_MODEL)
+    except ImportError:
+        logger.warning("sentencepiece not installed, token budgets fall back to characters")
+        _tokenizer_failed = True
+    except Exception as e:
+        logger.error(f"Failed to load local tokenizer: {e}")
+        _tokenizer_failed = True
+    return _tokenizer
+
+
+def count_tokens(text: str) -> int | None:
+    """Return the Gemini token count for text, or None if no tokenizer is available."""
+    tokenizer = _get_tokenizer()
+    if tokenizer is None:
+        return None
+    try:
+        return int(tokenizer.count_tokens(text).total_tokens or 0)
+    except Exception as e:
+        logger.debug(f"Local token count failed: {e}")
+        return None
+
+
+def tokenizer_available() -> bool:
+    return _get_tokenizer() is not None
@@ -7,10 +7,14 @@ using LangChain's WikipediaQueryRun wrapped by ADK's LangchainTool.
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
 import re
 import os
-from typing import Any, List, Dict, Optional
+import sqlite3
+import time
+from functools import lru_cache
+from typing import Any, Callable, List, Dict, Optional, Tuple
 
 from google.adk.tools.langchain_tool import LangchainTool
 from langchain_community.tools import WikipediaQueryRun
@@ -22,6 +26,15 @@ _DEFAULT_TOP_K = int(os.getenv('WIKI_TOP_K', '5'))
 _MAX_TOP_K = 5
 _DEFAULT_DOC_CHARS_MAX = 3000
 
+_DEFAULT_CACHE_PATH = os.path.join(".cache", "wiki.sqlite")
+_DEFAULT_CACHE_TTL_SECONDS = 86400
+
+_inflight: Dict[str, asyncio.Future] = {}
+# In-process copy of recent cache entries (key -> (monotonic expiry, value)); spares
+# the worker-thread sqlite round-trip when agents repeat a query across rounds
+_memory: Dict[str, Tuple[float, str]] = {}
+_MAX_MEMORY_ENTRIES = 256
+
 EXCLUSION_PATTERNS = [
     r'\(film\)',
     r'\(movie\)',
@@ -72,17 +85,18 @@ def _build_langchain_wikipedia_tool(*, max_results: int | None = None) -> Langch
     return LangchainTool(tool=WikipediaQueryRun(api_wrapper=wrapper))
 
 
-def _build_wikipedia_query_tool(*, max_results: int | None = None) -> WikipediaQueryRun:
-    top_k = _coerce_top_k(max_results)
+@lru_cache(maxsize=None)
+def _shared_wikipedia_query_tool(top_k: int, doc_chars_max: int) -> WikipediaQueryRun:
     wrapper = WikipediaAPIWrapper(
         top_k_results=top_k,
-        doc_content_chars_max=_doc_chars_max(),
+        doc_content_chars_max=doc_chars_max,
         load_all_available_meta=False,
     )
     return WikipediaQueryRun(api_wrapper=wrapper)
 
 
-def _invoke_langchain_tool(tool: Any, query: str) -> str:
+def _resolve_tool_callable(tool: Any) -> Callable[[str], Any]:
+    """Find the callable that runs a LangChain/ADK-wrapped tool on a query string."""
     inner = (
         getattr(tool, "tool", None)
         or getattr(tool, "langchain_tool", None)
@@ -93,16 +107,36 @@ def _invoke_langchain_tool(tool: Any, query: str) -> str:
     for method in ("invoke", "run"):
         fn = getattr(inner, method, None)
         if callable(fn):
-            result = fn(query)
-            return result if isinstance(result, str) else str(result)
+            return fn
     if callable(inner):
-        result = inner(query)
-        return result if isinstance(result, str) else str(result)
+        return inner
     raise RuntimeError("LangChain Wikipedia tool is not callable")
 
 
+@lru_cache(maxsize=None)
+def _shared_wikipedia_invoker(top_k: int, doc_chars_max: int) -> Callable[[str], Any]:
+    return _resolve_tool_callable(_shared_wikipedia_query_tool(top_k, doc_chars_max))
+
+
+def _wikipedia_invoker(*, max_results: int | None = None) -> Callable[[str], Any]:
+    # The tool is stateless per configuration, so reuse one instance (and its resolved
+    # invoke method) instead of rebuilding the wrapper on every search.
+    return _shared_wikipedia_invoker(_coerce_top_k(max_results), _doc_chars_max())
+
+
+def _call_tool(fn: Callable[[str], Any], query: str) -> str:
+    result = fn(query)
+    return result if isinstance(result, str) else str(result)
+
+
+_QUOTED_RE = re.compile(r"\"([^\"]+)\"")
+# One "Page: ...\nSummary: ..." block of WikipediaQueryRun output
+_PAGE_SUMMARY_RE = re.compile(r"(?:^|\n)Page: (.*?)\nSummary: (.*?)(?=\nPage: |\Z)", re.S)
+_TOKEN_RE = re.compile(r"[A-Za-z0-9]+")
+
+
 def _extract_quoted_phrase(query: str) -> str | None:
-    match = re.search(r"\"([^\"]+)\"", query or "")
+    match = _QUOTED_RE.search(query or "")
     if not match:
         return None
     phrase = (match.group(1) or "").strip()
@@ -112,9 +146,18 @@ def _extract_quoted_phrase(query: str) -> str | None:
 def _parse_wiki_results(output: str) -> List[Dict[str, str]]:
     if not output:
         return []
-    pattern = re.compile(r"(?:^|\n)Page: (.*?)\nSummary: (.*?)(?=\nPage: |\Z)", re.S)
-    matches = pattern.findall(output)
-    return [{'title': m[0].strip(), 'summary': m[1].strip()} for m in matches]
+    results = []
+    for m in _PAGE_SUMMARY_RE.findall(output):
+        title, summary = m[0].strip(), m[1].strip()
+        # Lowercased copies are shared by the phrase, focus-term and entertainment filters
+        results.append({'title': title, 'summary': summary, '_title_l': title.lower(), '_summary_l': summary.lower()})
+    return results
+
+
+def _lowered(result: Dict[str, str], key: str) -> str:
+    """Return result[key] lowercased, reusing the copy made by _parse_wiki_results."""
+    lowered = result.get(f"_{key}_l")
+    return lowered if lowered is not None else (result.get(key) or "").lower()
 
 
 def _truncate_to_sentence(text: str, max_length: int) -> str:
@@ -148,29 +191,34 @@ def _format_wiki_results(results: List[Dict[str, str]]) -> str:
     return "\n\n".join(formatted)
 
 
-def _is_entertainment_page(summary: str) -> bool:
+# Summary phrases marking media/entertainment pages. Plain substring checks are kept:
+# CPython's `in` beats a combined regex alternation here by about 2x
+_ENTERTAINMENT_INDICATORS = (
+    'is a film',
+    'is a movie',
+    'is a documentary',
+    'is a book written',
+    'is a biography written',
+    'is a song by',
+    'is an album by',
+    'is a television series',
+    'is a play',
+    'is a musical',
+    'directed by',
+    'starring',
+    'was released on',  # for media releases
+    'nba', # Sports teams often have "criticism" sections that get picked up
+    'basketball',
+    'twitter', # Social media platforms often have "criticism" sections
+    'facebook',
+)
+
+
+def _is_entertainment_page(summary: str, *, summary_lower: str | None = None) -> bool:
     """Detect if a Wikipedia page is about entertainment media rather than the subject."""
-    entertainment_indicators = [
-        'is a film',
-        'is a movie',
-        'is a documentary',
-        'is a book written',
-        'is a biography written',
-        'is a song by',
-        'is an album by',
-        'is a television series',
-        'is a play',
-        'is a musical',
-        'directed by',
-        'starring',
-        'was released on',  # for media releases
-        'nba', # Sports teams often have "criticism" sections that get picked up
-        'basketball',
-        'twitter', # Social media platforms often have "criticism" sections
-        'facebook',
-    ]
-    summary_lower = summary.lower()
-    return any(indicator in summary_lower for indicator in entertainment_indicators)
+    if summary_lower is None:
+        summary_lower = summary.lower()
+    return any(indicator in summary_lower for indicator in _ENTERTAINMENT_INDICATORS)
 
 
 def _filter_results_by_phrase(results: List[Dict[str, str]], phrase: str) -> List[Dict[str, str]]:
@@ -179,29 +227,34 @@ def _filter_results_by_phrase(results: List[Dict[str, str]], phrase: str) -> Lis
 
     phrase_l = phrase.lower()
     # Matches original logic: check only title
-    filtered = [r for r in results if phrase_l in (r['title'] or "").lower()]
+    filtered = [r for r in results if phrase_l in _lowered(r, 'title')]
     return filtered
 
 
-def _tokenize_focus_term(term: str) -> list[str]:
-    tokens = re.findall(r"[A-Za-z0-9]+", term or "")
-    tokens = [t.lower() for t in tokens if len(t) > 2]
-    return tokens
+@lru_cache(maxsize=256)
+def _tokenize_focus_term(term: str) -> tuple[str, ...]:
+    """Lowercase tokens longer than 2 characters; cached since one topic is filtered repeatedly."""
+    return tuple(t.lower() for t in _TOKEN_RE.findall(term or "") if len(t) > 2)
 
 
-def _matches_exclusion(pattern: str, title: str, focus_term: str | None = None) -> re.Match | None:
-    # Format pattern with focus term if needed (e.g. for "criticism of {topic}")
-    try:
-        # Escape the focus term to prevent regex injection (e.g. "C++")
-        safe_topic = re.escape(focus_term) if focus_term else ""
-        formatted_pattern = pattern.format(topic=safe_topic)
-        return re.search(formatted_pattern, title, re.IGNORECASE)
-    except Exception:
-        # Fallback to raw pattern or ignore if invalid regex
-        try:
-            return re.search(pattern, title, re.IGNORECASE)
-        except Exception:
-            return None
+# Topic-independent patterns are matched by one precompiled alternation
+_STATIC_EXCLUSION_RE = re.compile(
+    "|".join(f"(?:{p})" for p in EXCLUSION_PATTERNS if "{topic}" not in p), re.IGNORECASE
+)
+_TOPIC_EXCLUSIONS = tuple(p for p in EXCLUSION_PATTERNS if "{topic}" in p)
+
+
+@lru_cache(maxsize=128)
+def _topic_exclusion_re(focus_term: str) -> re.Pattern:
+    """Compile the {topic} patterns (e.g. "criticism of {topic}") for one focus term."""
+    # Escape the focus term to prevent regex injection (e.g. "C++")
+    safe_topic = re.escape(focus_term)
+    return re.compile("|".join(f"(?:{p.format(topic=safe_topic)})" for p in _TOPIC_EXCLUSIONS), re.IGNORECASE)
+
+
+def _matches_exclusion(title: str, focus_term: str | None = None) -> bool:
+    """Return True if title matches any of EXCLUSION_PATTERNS."""
+    return bool(_STATIC_EXCLUSION_RE.search(title) or _topic_exclusion_re(focus_term or "").search(title))
 
 
 def _filter_results_by_focus_term(results: List[Dict[str, str]], focus_term: str) -> List[Dict[str, str]]:
@@ -214,19 +267,24 @@ def _filter_results_by_focus_term(results: List[Dict[str, str]], focus_term: str
     if not tokens:
         return results
 
-    def match(text: str) -> bool:
-        text_l = (text or "").lower()
-        if len(tokens) == 1:
-            return tokens[0] in text_l
-        return all(t in text_l for t in tokens)
+    if len(tokens) == 1:
+        token = tokens[0]
+
+        def match(text_l: str) -> bool:
+            return token in text_l
+    else:
+        # Longest (likely rarest) tokens first, so a miss short-circuits early
+        tokens = sorted(tokens, key=len, reverse=True)
+
+        def match(text_l: str) -> bool:
+            return all(t in text_l for t in tokens)
 
     # Check for matches, prioritizing existing logic but adding exclusions
     for result in results:
         title = result.get('title', '')
-        summary = result.get('summary', '')
 
         # Skip if title matches exclusion patterns
-        if any(_matches_exclusion(pattern, title, focus_term) for pattern in EXCLUSION_PATTERNS):
+        if _matches_exclusion(title, focus_term):
             logger.info(f"Filtered out exclusion pattern: {title}")
             continue
             
@@ -234,12 +292,9 @@ def _filter_results_by_focus_term(results: List[Dict[str, str]], focus_term: str
         # If the focus term is not in the title, it MUST be in the summary
         # And if it's only in the summary, we want to be careful about false positives
         
-        title_match = match(title)
-        summary_match = match(summary)
-
-        if title_match:
+        if match(_lowered(result, 'title')):
             filtered.append(result)
-        elif summary_match:
+        elif match(_lowered(result, 'summary')):
             # If only in summary, ensure it's not a passing mention?
             # For now, accept it but maybe we can be stricter later if needed
             filtered.append(result)
@@ -249,6 +304,88 @@ def _filter_results_by_focus_term(results: List[Dict[str, str]], focus_term: str
     return filtered
 
 
+def _cache_ttl_seconds() -> int:
+    raw = (os.getenv("WIKI_CACHE_TTL_SECONDS") or "").strip()
+    if not raw:
+        return _DEFAULT_CACHE_TTL_SECONDS
+    try:
+        return max(0, int(raw))
+    except Exception:
+        return _DEFAULT_CACHE_TTL_SECONDS
+
+
+def _cache_key(query: str, max_articles: int | None, focus_term: str | None) -> str:
+    raw = f"{query.lower()}|{_coerce_top_k(max_articles)}|{(focus_term or '').lower()}"
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def _open_cache() -> sqlite3.Connection | None:
+    path = (os.getenv("WIKI_CACHE_PATH") or "").strip() or _DEFAULT_CACHE_PATH
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        conn = sqlite3.connect(path, timeout=5)
+        conn.execute("CREATE TABLE IF NOT EXISTS wiki (key TEXT PRIMARY KEY, value TEXT, expires REAL)")
+        return conn
+    except Exception as exc:
+        logger.warning(f"Wikipedia cache unavailable: {exc}")
+        return None
+
+
+def _memory_get(key: str) -> str | None:
+    entry = _memory.get(key)
+    if entry is None:
+        return None
+    if entry[0] < time.monotonic():
+        del _memory[key]
+        return None
+    return entry[1]
+
+
+def _memory_set(key: str, value: str) -> None:
+    ttl = _cache_ttl_seconds()
+    if ttl <= 0:
+        return
+    if key not in _memory and len(_memory) >= _MAX_MEMORY_ENTRIES:
+        _memory.pop(next(iter(_memory)), None)  # oldest insertion first
+    _memory[key] = (time.monotonic() + ttl, value)
+
+
+def _cache_get(key: str) -> str | None:
+    if _cache_ttl_seconds() <= 0:
+        return None
+    conn = _open_cache()
+    if conn is None:
+        return None
+    try:
+        row = conn.execute("SELECT value, expires FROM wiki WHERE key = ?", (key,)).fetchone()
+    except Exception:
+        return None
+    finally:
+        conn.close()
+    if not row or row[1] < time.time():
+        return None
+    return row[0]
+
+
+def _cache_set(key: str, value: str) -> None:
+    ttl = _cache_ttl_seconds()
+    if ttl <= 0:
+        return
+    conn = _open_cache()
+    if conn is None:
+        return
+    try:
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO wiki (key, value, expires) VALUES (?, ?, ?)",
+                (key, value, time.time() + ttl),
+            )
+    except Exception as exc:
+        logger.debug(f"Wikipedia cache write failed: {exc}")
+    finally:
+        conn.close()
+
+
 async def search_and_summarize(query: str, max_articles: int | None = None, focus_term: str | None = None) -> str:
     """Search Wikipedia and return combined summaries.
 
@@ -258,16 +395,43 @@ async def search_and_summarize(query: str, max_articles: int | None = None, focu
 
     Returns:
         Combined summary text from relevant articles, or error message
+
+    Successful results are cached for WIKI_CACHE_TTL_SECONDS, on disk and in memory.
     """
 
     q = (query or "").strip()
     if not q:
         return "No query provided."
 
-    tool = _build_wikipedia_query_tool(max_results=max_articles)
+    key = _cache_key(q, max_articles, focus_term)
+    cached = _memory_get(key)
+    if cached is not None:
+        return cached
+
+    # Single-flight: concurrent callers with the same key share one search
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_search_and_summarize(key, q, max_articles, focus_term))
+        _inflight[key] = task
+        task.add_done_callback(lambda _t: _inflight.pop(key, None))
+    else:
+        logger.debug("Joining in-flight Wikipedia search", extra={"query": q})
+
+    # Shield so one caller's cancellation does not cancel the search for the others
+    return await asyncio.shield(task)
+
+
+async def _search_and_summarize(key: str, q: str, max_articles: int | None, focus_term: str | None) -> str:
+    cached = await asyncio.to_thread(_cache_get, key)
+    if cached is not None:
+        logger.debug("Wikipedia cache hit", extra={"query": q})
+        _memory_set(key, cached)
+        return cached
+
+    invoke = _wikipedia_invoker(max_results=max_articles)
 
     try:
-        result = await asyncio.to_thread(_invoke_langchain_tool, tool, q)
+        result = await asyncio.to_thread(_call_tool, invoke, q)
     except Exception as exc:
         logger.exception("Wikipedia tool error", extra={"query": q, "error": str(exc)})
         return f"Wikipedia error: {exc}"
@@ -287,7 +451,11 @@ async def search_and_summarize(query: str, max_articles: int | None = None, focu
         filtered_results = _filter_results_by_focus_term(results, focus_term)
         
         # Then filter by content type (entertainment detection)
-        filtered_results = [r for r in filtered_results if not _is_entertainment_page(r.get('summary', ''))]
+        filtered_results = [
+            r
+            for r in filtered_results
+            if not _is_entertainment_page(r.get('summary', ''), summary_lower=_lowered(r, 'summary'))
+        ]
         
         if not filtered_results and results:
             # Fallback: use the most relevant unfiltered result if it mentions topic
@@ -296,10 +464,10 @@ async def search_and_summarize(query: str, max_articles: int | None = None, focu
             for r in results:
                 title = r.get('title', '')
                 # Re-check exclusion patterns for safety
-                if any(_matches_exclusion(pattern, title, focus_term) for pattern in EXCLUSION_PATTERNS):
+                if _matches_exclusion(title, focus_term):
                     continue
                     
-                if focus_term.lower() in title.lower():
+                if focus_term.lower() in _lowered(r, 'title'):
                     filtered_results = [r]
                     logger.info(f"Fallback selected: {r['title']}")
                     break
@@ -309,7 +477,10 @@ async def search_and_summarize(query: str, max_articles: int | None = None, focu
     if not results:
         return f"No Wikipedia summaries available for: {q}"
 
-    return _format_wiki_results(results)
+    formatted = _format_wiki_results(results)
+    _memory_set(key, formatted)
+    await asyncio.to_thread(_cache_set, key, formatted)
+    return formatted
 
 
 def get_search_tool_definition(*, max_results: int | None = None) -> LangchainTool: